@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+import sys
+from collections.abc import Mapping, Sequence
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
 from thenvoi_cli.exceptions import MissingDependencyError
 
@@ -12,120 +16,143 @@ if TYPE_CHECKING:
     pass
 
 
-@dataclass
-class AdapterInfo:
+class AdapterInfo(NamedTuple):
     """Information about an adapter."""
 
     name: str
     class_name: str
     module: str
     description: str
-    required_deps: list[str]
+    required_deps: tuple[str, ...]
     default_model: str | None
-    env_vars: list[str]
-
-
-# Registry of all available adapters
-ADAPTERS: dict[str, AdapterInfo] = {
-    "langgraph": AdapterInfo(
-        name="langgraph",
-        class_name="LangGraphAdapter",
-        module="thenvoi.adapters.langgraph",
-        description="LangGraph ReAct agent with tool support",
-        required_deps=["langgraph", "langchain_openai"],
-        default_model="gpt-4o",
-        env_vars=["OPENAI_API_KEY"],
-    ),
-    "anthropic": AdapterInfo(
-        name="anthropic",
-        class_name="AnthropicAdapter",
-        module="thenvoi.adapters.anthropic",
-        description="Anthropic SDK with direct Claude integration",
-        required_deps=["anthropic"],
-        default_model="claude-sonnet-4-5-20250929",
-        env_vars=["ANTHROPIC_API_KEY"],
-    ),
-    "pydantic-ai": AdapterInfo(
-        name="pydantic-ai",
-        class_name="PydanticAIAdapter",
-        module="thenvoi.adapters.pydantic_ai",
-        description="Pydantic AI with type-safe tools",
-        required_deps=["pydantic_ai"],
-        default_model="openai:gpt-4o",
-        env_vars=["OPENAI_API_KEY"],
-    ),
-    "claude-sdk": AdapterInfo(
-        name="claude-sdk",
-        class_name="ClaudeSDKAdapter",
-        module="thenvoi.adapters.claude_sdk",
-        description="Claude Agent SDK with extended thinking",
-        required_deps=["claude_agent_sdk"],
-        default_model="claude-sonnet-4-5-20250929",
-        env_vars=["ANTHROPIC_API_KEY"],
-    ),
-    "crewai": AdapterInfo(
-        name="crewai",
-        class_name="CrewAIAdapter",
-        module="thenvoi.adapters.crewai",
-        description="CrewAI role-based multi-agent framework",
-        required_deps=["crewai"],
-        default_model="gpt-4o",
-        env_vars=["OPENAI_API_KEY"],
-    ),
-    "parlant": AdapterInfo(
-        name="parlant",
-        class_name="ParlantAdapter",
-        module="thenvoi.adapters.parlant",
-        description="Parlant guideline-based behavior framework",
-        required_deps=["parlant"],
-        default_model="gpt-4o",
-        env_vars=["OPENAI_API_KEY"],
-    ),
-    "a2a": AdapterInfo(
-        name="a2a",
-        class_name="A2AAdapter",
-        module="thenvoi.adapters.a2a",
-        description="A2A protocol adapter for external agents",
-        required_deps=["a2a_sdk"],
-        default_model=None,
-        env_vars=[],
-    ),
-    "a2a-gateway": AdapterInfo(
-        name="a2a-gateway",
-        class_name="A2AGatewayAdapter",
-        module="thenvoi.adapters.a2a_gateway",
-        description="A2A gateway to expose peers as endpoints",
-        required_deps=["a2a_sdk", "starlette", "uvicorn"],
-        default_model=None,
-        env_vars=[],
-    ),
-    "passthrough": AdapterInfo(
-        name="passthrough",
-        class_name="PassthroughAdapter",
-        module="thenvoi_cli.adapters.passthrough",
-        description="Output messages to stdout without LLM processing",
-        required_deps=[],
-        default_model=None,
-        env_vars=[],
-    ),
-}
-
-
+    env_vars: tuple[str, ...]
+
+
+# Registry of all available adapters (read-only)
+ADAPTERS: Mapping[str, AdapterInfo] = MappingProxyType(
+    {
+        "langgraph": AdapterInfo(
+            name="langgraph",
+            class_name="LangGraphAdapter",
+            module="thenvoi.adapters.langgraph",
+            description="LangGraph ReAct agent with tool support",
+            required_deps=("langgraph", "langchain_openai"),
+            default_model="gpt-4o",
+            env_vars=("OPENAI_API_KEY",),
+        ),
+        "anthropic": AdapterInfo(
+            name="anthropic",
+            class_name="AnthropicAdapter",
+            module="thenvoi.adapters.anthropic",
+            description="Anthropic SDK with direct Claude integration",
+            required_deps=("anthropic",),
+            default_model="claude-sonnet-4-5-20250929",
+            env_vars=("ANTHROPIC_API_KEY",),
+        ),
+        "pydantic-ai": AdapterInfo(
+            name="pydantic-ai",
+            class_name="PydanticAIAdapter",
+            module="thenvoi.adapters.pydantic_ai",
+            description="Pydantic AI with type-safe tools",
+            required_deps=("pydantic_ai",),
+            default_model="openai:gpt-4o",
+            env_vars=("OPENAI_API_KEY",),
+        ),
+        "claude-sdk": AdapterInfo(
+            name="claude-sdk",
+            class_name="ClaudeSDKAdapter",
+            module="thenvoi.adapters.claude_sdk",
+            description="Claude Agent SDK with extended thinking",
+            required_deps=("claude_agent_sdk",),
+            default_model="claude-sonnet-4-5-20250929",
+            env_vars=("ANTHROPIC_API_KEY",),
+        ),
+        "crewai": AdapterInfo(
+            name="crewai",
+            class_name="CrewAIAdapter",
+            module="thenvoi.adapters.crewai",
+            description="CrewAI role-based multi-agent framework",
+            required_deps=("crewai",),
+            default_model="gpt-4o",
+            env_vars=("OPENAI_API_KEY",),
+        ),
+        "parlant": AdapterInfo(
+            name="parlant",
+            class_name="ParlantAdapter",
+            module="thenvoi.adapters.parlant",
+            description="Parlant guideline-based behavior framework",
+            required_deps=("parlant",),
+            default_model="gpt-4o",
+            env_vars=("OPENAI_API_KEY",),
+        ),
+        "a2a": AdapterInfo(
+            name="a2a",
+            class_name="A2AAdapter",
+            module="thenvoi.adapters.a2a",
+            description="A2A protocol adapter for external agents",
+            required_deps=("a2a_sdk",),
+            default_model=None,
+            env_vars=(),
+        ),
+        "a2a-gateway": AdapterInfo(
+            name="a2a-gateway",
+            class_name="A2AGatewayAdapter",
+            module="thenvoi.adapters.a2a_gateway",
+            description="A2A gateway to expose peers as endpoints",
+            required_deps=("a2a_sdk", "starlette", "uvicorn"),
+            default_model=None,
+            env_vars=(),
+        ),
+        "passthrough": AdapterInfo(
+            name="passthrough",
+            class_name="PassthroughAdapter",
+            module="thenvoi_cli.adapters.passthrough",
+            description="Output messages to stdout without LLM processing",
+            required_deps=(),
+            default_model=None,
+            env_vars=(),
+        ),
+    }
+)
+
+_ADAPTER_NAMES: Final[tuple[str, ...]] = tuple(ADAPTERS)
+_ADAPTER_NAMES_JOINED: Final[str] = ", ".join(_ADAPTER_NAMES)
+
+# Adapters without optional dependencies are always available
+_NO_DEPS: Final[frozenset[str]] = frozenset(
+    name for name, info in ADAPTERS.items() if not info.required_deps
+)
+
+
+@functools.cache
 def _is_package_installed(package_name: str) -> bool:
-    """Check if a Python package is installed."""
-    try:
-        importlib.import_module(package_name)
+    """Check if a Python package is installed.
+
+    Modules that are already imported are answered from sys.modules.
+    Otherwise the module spec is resolved without executing the module body,
+    so probing heavy frameworks doesn't pay their import cost. Results are
+    cached since installed packages don't change during a CLI invocation.
+    """
+    if sys.modules.get(package_name) is not None:
         return True
-    except ImportError:
+    try:
+        return find_spec(package_name) is not None
+    except (ValueError, ModuleNotFoundError):
         return False
 
 
 class AdapterRegistry:
     """Registry for discovering and loading adapters."""
 
-    def list_adapters(self) -> list[str]:
+    def __init__(self) -> None:
+        # Missing dependencies per adapter, computed on first lookup
+        self._missing_deps: dict[str, list[str]] = {}
+        # Adapter classes already resolved by get_adapter_class
+        self._class_cache: dict[str, type[Any]] = {}
+
+    def list_adapters(self) -> tuple[str, ...]:
         """List all registered adapter names."""
-        return list(ADAPTERS.keys())
+        return _ADAPTER_NAMES
 
     def get_adapter_info(self, name: str) -> AdapterInfo | None:
         """Get information about an adapter.
@@ -147,11 +174,12 @@ class AdapterRegistry:
         Returns:
             True if all dependencies are available.
         """
-        info = ADAPTERS.get(name)
-        if not info:
+        if name in _NO_DEPS:
+            return True
+        if name not in ADAPTERS:
             return False
 
-        return all(_is_package_installed(dep) for dep in info.required_deps)
+        return not self.get_missing_deps(name)
 
     def get_missing_deps(self, name: str) -> list[str]:
         """Get list of missing dependencies for an adapter.
@@ -162,11 +190,18 @@ class AdapterRegistry:
         Returns:
             List of missing package names.
         """
+        if name in _NO_DEPS:
+            return []
+
         info = ADAPTERS.get(name)
         if not info:
             return []
 
-        return [dep for dep in info.required_deps if not _is_package_installed(dep)]
+        missing = self._missing_deps.get(name)
+        if missing is None:
+            missing = [dep for dep in info.required_deps if not _is_package_installed(dep)]
+            self._missing_deps[name] = missing
+        return list(missing)
 
     def get_adapter_class(self, name: str) -> type[Any]:
         """Get the adapter class, importing it lazily.
@@ -181,17 +216,22 @@ class AdapterRegistry:
             ValueError: If the adapter is not found.
             MissingDependencyError: If dependencies are not installed.
         """
+        cached = self._class_cache.get(name)
+        if cached is not None:
+            return cached
+
         info = ADAPTERS.get(name)
         if not info:
-            available = ", ".join(self.list_adapters())
-            raise ValueError(f"Unknown adapter '{name}'. Available: {available}")
+            raise ValueError(f"Unknown adapter '{name}'. Available: {_ADAPTER_NAMES_JOINED}")
 
         missing = self.get_missing_deps(name)
         if missing:
             raise MissingDependencyError(name, missing)
 
         module = importlib.import_module(info.module)
-        return getattr(module, info.class_name)  # type: ignore[no-any-return]
+        adapter_class: type[Any] = getattr(module, info.class_name)
+        self._class_cache[name] = adapter_class
+        return adapter_class
 
     def get_default_model(self, name: str) -> str | None:
         """Get the default model for an adapter.
@@ -205,7 +245,7 @@ class AdapterRegistry:
         info = ADAPTERS.get(name)
         return info.default_model if info else None
 
-    def get_required_env_vars(self, name: str) -> list[str]:
+    def get_required_env_vars(self, name: str) -> Sequence[str]:
         """Get required environment variables for an adapter.
 
         Args:
@@ -215,8 +255,17 @@ class AdapterRegistry:
             List of required environment variable names.
         """
         info = ADAPTERS.get(name)
-        return info.env_vars if info else []
+        return info.env_vars if info else ()
+
+
+# Global registry instance, created on first access via __getattr__
+registry: AdapterRegistry
 
 
-# Global registry instance
-registry = AdapterRegistry()
+def __getattr__(name: str) -> Any:
+    """Lazily create module-level singletons."""
+    if name == "registry":
+        instance = AdapterRegistry()
+        globals()["registry"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
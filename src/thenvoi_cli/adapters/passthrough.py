@@ -6,6 +6,8 @@ import json
 import sys
 from typing import TYPE_CHECKING, Any
 
+from thenvoi_cli.compat import orjson
+
 if TYPE_CHECKING:
     from thenvoi.core.protocols import AgentToolsProtocol
     from thenvoi.core.types import AgentInput, PlatformMessage
@@ -86,12 +88,26 @@ class PassthroughAdapter:
                 "message_type": msg.message_type,
                 "timestamp": msg.created_at.isoformat(),
             }
-            print(json.dumps(output), file=sys.stdout, flush=True)
+            self._write_line(_dumps(output))
         else:
             # Plain text format
             sender = msg.sender_name or msg.sender_type or "Unknown"
             print(f"[{room_id}] {sender}: {msg.content}", file=sys.stdout, flush=True)
 
+    def _write_line(self, line: bytes) -> None:
+        """Write one newline-terminated line to stdout and flush it.
+
+        Flushes every line so consumers reading the pipe see messages as
+        they arrive.
+        """
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(line.decode() + "\n")
+            sys.stdout.flush()
+        else:
+            buffer.write(line + b"\n")
+            buffer.flush()
+
     async def on_cleanup(self, room_id: str) -> None:
         """Clean up when leaving a room (no-op for passthrough)."""
         pass
@@ -100,3 +116,11 @@ class PassthroughAdapter:
         """Called after agent starts."""
         self.agent_name = agent_name
         self.agent_description = agent_description
+
+
+def _dumps(obj: dict[str, Any]) -> bytes:
+    """Serialize a message to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj)
+        return encoded
+    return json.dumps(obj).encode()
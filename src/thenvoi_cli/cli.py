@@ -2,27 +2,113 @@
 
 from __future__ import annotations
 
+import importlib
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
+from rich import get_console
+from typer.core import TyperGroup
 
 from thenvoi_cli import __version__
 from thenvoi_cli.logging_config import setup_logging
 from thenvoi_cli.output import OutputFormat
 
+if TYPE_CHECKING:
+    import click
+
+# Command modules, imported only when their command is resolved.
+# Maps command name to (module, attribute, short help); the attribute is
+# either a Typer sub-app or a plain command function. The short help is
+# listed by the root --help so it does not have to import every module.
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "run": (
+        "thenvoi_cli.commands.run",
+        "run",
+        "Run an agent connected to the Thenvoi platform.",
+    ),
+    "status": ("thenvoi_cli.commands.status", "status", "Show status of running agents."),
+    "stop": ("thenvoi_cli.commands.status", "stop", "Stop a running agent."),
+    "test": ("thenvoi_cli.commands.test", "test", "Test agent configuration and connectivity."),
+    "peers": (
+        "thenvoi_cli.commands.peers",
+        "peers",
+        "List available peers for multi-agent collaboration.",
+    ),
+    "agents": (
+        "thenvoi_cli.commands.agents",
+        "app",
+        "Manage agents on the platform (requires User API key).",
+    ),
+    "config": ("thenvoi_cli.commands.config", "app", "Manage agent configurations."),
+    "rooms": ("thenvoi_cli.commands.rooms", "app", "Manage chat rooms."),
+    "participants": ("thenvoi_cli.commands.participants", "app", "Manage room participants."),
+    "adapters": ("thenvoi_cli.commands.adapters", "app", "Discover and learn about adapters."),
+    "batch": (
+        "thenvoi_cli.commands.batch",
+        "batch",
+        "Run CLI commands read from stdin, one per line.",
+    ),
+}
+
+# ctx.meta key set while the root group renders its own help
+_LISTING_HELP = "thenvoi_cli.listing_help"
+
+
+def _load_command(name: str) -> click.Command:
+    """Import a lazily registered command and build its click command."""
+    module_name, attr, _ = LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+
+    command: click.Command
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_group(target)
+    else:
+        # Wrap standalone command functions in a single-command app
+        single = typer.Typer(add_completion=False, rich_markup_mode="rich")
+        single.command(name=name)(target)
+        command = typer.main.get_command(single)
+
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on demand."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        eager = super().list_commands(ctx)
+        return [*LAZY_COMMANDS, *(name for name in eager if name not in LAZY_COMMANDS)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            if ctx.meta.get(_LISTING_HELP):
+                # Help only needs the name and summary; don't cache the stub
+                from click import Command
+
+                return Command(cmd_name, short_help=LAZY_COMMANDS[cmd_name][2])
+            command = _load_command(cmd_name)
+            self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        ctx.meta[_LISTING_HELP] = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            del ctx.meta[_LISTING_HELP]
+
+
 # Create the main app
 app = typer.Typer(
     name="thenvoi-cli",
     help="CLI for the Thenvoi AI agent platform.",
     no_args_is_help=True,
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-# Console for output
-console = Console()
-
 # Global state
 state: dict[str, object] = {}
 
@@ -30,7 +116,7 @@ state: dict[str, object] = {}
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(f"thenvoi-cli {__version__}")
+        get_console().print(f"thenvoi-cli {__version__}")
         raise typer.Exit()
 
 
@@ -74,6 +160,13 @@ def main(
         "-f",
         help="Output format.",
     ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        envvar="THENVOI_ASSUME_YES",
+        help="Answer yes to confirmation prompts (for scripts and CI).",
+    ),
 ) -> None:
     """Thenvoi CLI - AI agent platform interface.
 
@@ -91,7 +184,7 @@ def main(
     logger = setup_logging(
         verbosity=verbosity,
         log_file=log_file,
-        no_color=os.getenv("NO_COLOR") is not None,
+        no_color="NO_COLOR" in os.environ,
     )
 
     # Store state for subcommands
@@ -100,31 +193,7 @@ def main(
     ctx.obj["debug"] = debug
     ctx.obj["format"] = format
     ctx.obj["verbosity"] = verbosity
-
-
-# Import and register command groups
-from thenvoi_cli.commands import adapters as adapters_cmd
-from thenvoi_cli.commands import agents as agents_cmd
-from thenvoi_cli.commands import config as config_cmd
-from thenvoi_cli.commands import participants as participants_cmd
-from thenvoi_cli.commands import peers as peers_cmd
-from thenvoi_cli.commands import rooms as rooms_cmd
-from thenvoi_cli.commands import run as run_cmd
-from thenvoi_cli.commands import status as status_cmd
-from thenvoi_cli.commands import test as test_cmd
-
-app.add_typer(agents_cmd.app, name="agents")
-app.add_typer(config_cmd.app, name="config")
-app.add_typer(rooms_cmd.app, name="rooms")
-app.add_typer(participants_cmd.app, name="participants")
-app.add_typer(adapters_cmd.app, name="adapters")
-
-# Add standalone commands
-app.command(name="run")(run_cmd.run)
-app.command(name="status")(status_cmd.status)
-app.command(name="stop")(status_cmd.stop)
-app.command(name="test")(test_cmd.test)
-app.command(name="peers")(peers_cmd.peers)
+    ctx.obj["assume_yes"] = yes
 
 
 # Completion command
@@ -142,41 +211,31 @@ def completion(
         thenvoi-cli completion zsh >> ~/.zshrc
         thenvoi-cli completion fish > ~/.config/fish/completions/thenvoi-cli.fish
     """
-    import subprocess
-    import sys
-
-    # Use typer's built-in completion generation
-    script_name = "thenvoi-cli"
-
-    if shell == "bash":
-        result = subprocess.run(
-            [sys.executable, "-m", "typer", "thenvoi_cli.cli", "utils", "completion", "--name", script_name, "--shell", "bash"],
-            capture_output=True,
-            text=True,
-        )
-    elif shell == "zsh":
-        result = subprocess.run(
-            [sys.executable, "-m", "typer", "thenvoi_cli.cli", "utils", "completion", "--name", script_name, "--shell", "zsh"],
-            capture_output=True,
-            text=True,
-        )
-    elif shell == "fish":
-        result = subprocess.run(
-            [sys.executable, "-m", "typer", "thenvoi_cli.cli", "utils", "completion", "--name", script_name, "--shell", "fish"],
-            capture_output=True,
-            text=True,
-        )
-    else:
+    from click.shell_completion import get_completion_class
+    from typer._completion_classes import completion_init
+
+    console = get_console()
+
+    if shell not in ("bash", "zsh", "fish"):
         console.print(f"[red]Unknown shell: {shell}[/red]")
         console.print("Supported shells: bash, zsh, fish")
         raise typer.Exit(1)
 
-    if result.returncode == 0:
-        console.print(result.stdout)
-    else:
-        # Fallback: generate basic completion
+    # Register typer's completion classes so the script matches its runtime
+    completion_init()
+    completion_class = get_completion_class(shell)
+    if completion_class is None:
         console.print(f"# Completion for {shell} not available via typer")
-        console.print(f"# Install shell completions manually")
+        console.print("# Install shell completions manually")
+        return
+
+    script = completion_class(
+        cli=typer.main.get_command(app),
+        ctx_args={},
+        prog_name="thenvoi-cli",
+        complete_var="_THENVOI_CLI_COMPLETE",
+    ).source()
+    typer.echo(script)
 
 
 if __name__ == "__main__":
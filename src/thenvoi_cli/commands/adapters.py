@@ -2,22 +2,22 @@
 
 from __future__ import annotations
 
+import os
 from typing import Optional
 
 import typer
-from rich.console import Console
+from rich import get_console
 from rich.table import Table
 
 from thenvoi_cli.adapter_registry import ADAPTERS, registry
-from thenvoi_cli.output import OutputFormat
+from thenvoi_cli.output import OutputFormat, print_json
 
 app = typer.Typer(help="Discover and learn about adapters.")
-console = Console()
 
 
 @app.command("list")
 def list_adapters(
-    ctx: typer.Context = typer.Option(None),
+    ctx: typer.Context,
 ) -> None:
     """List all available adapters.
 
@@ -25,6 +25,7 @@ def list_adapters(
         thenvoi-cli adapters list
         thenvoi-cli adapters list --format json
     """
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     data = []
@@ -40,9 +41,7 @@ def list_adapters(
             })
 
     if fmt == OutputFormat.JSON:
-        import json
-
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
     elif fmt == OutputFormat.TABLE:
         table = Table(title="Available Adapters")
         table.add_column("Name", style="cyan")
@@ -75,6 +74,7 @@ def adapter_info(
         thenvoi-cli adapters info langgraph
         thenvoi-cli adapters info anthropic
     """
+    console = get_console()
     info = registry.get_adapter_info(name)
     if not info:
         available = ", ".join(registry.list_adapters())
@@ -82,8 +82,8 @@ def adapter_info(
         console.print(f"Available adapters: {available}")
         raise typer.Exit(1)
 
-    available = registry.is_available(name)
     missing = registry.get_missing_deps(name)
+    available = not missing
 
     console.print(f"\n[bold cyan]{info.name}[/bold cyan]")
     console.print(f"  {info.description}\n")
@@ -99,16 +99,11 @@ def adapter_info(
 
     console.print(f"\n[bold]Required Dependencies:[/bold]")
     for dep in info.required_deps:
-        from thenvoi_cli.adapter_registry import _is_package_installed
-
-        installed = _is_package_installed(dep)
-        status = "[green]Installed[/green]" if installed else "[red]Missing[/red]"
+        status = "[red]Missing[/red]" if dep in missing else "[green]Installed[/green]"
         console.print(f"  {dep}: {status}")
 
     if info.env_vars:
         console.print(f"\n[bold]Required Environment Variables:[/bold]")
-        import os
-
         for var in info.env_vars:
             is_set = os.getenv(var) is not None
             status = "[green]Set[/green]" if is_set else "[yellow]Not set[/yellow]"
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import operator
 import os
-from typing import Optional
+from collections.abc import Callable, Coroutine
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
 from thenvoi_cli.exceptions import ConfigurationError, MissingEnvironmentError
-from thenvoi_cli.output import OutputFormat, mask_api_key
+from thenvoi_cli.output import OutputFormat, mask_api_key, print_json
+
+if TYPE_CHECKING:
+    from thenvoi_rest import AsyncRestClient
 
 app = typer.Typer(help="Manage agents on the platform (requires User API key).")
-console = Console()
+
+T = TypeVar("T")
 
 
 def _get_user_api_key() -> str:
@@ -32,19 +37,52 @@ def _get_rest_url() -> str:
     return url
 
 
-async def _get_user_client():
-    """Get an async REST client with user API key."""
-    from thenvoi_rest import AsyncRestClient
+def _run(ctx: typer.Context, coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the event loop shared by this CLI invocation.
 
-    return AsyncRestClient(
-        api_key=_get_user_api_key(),
-        base_url=_get_rest_url(),
-    )
+    The runner is created on first use and closed with the root context,
+    so the user REST client keeps one loop for all of its requests.
+    """
+    root = ctx.find_root()
+    root.ensure_object(dict)
+    runner = root.obj.get("runner")
+    if runner is None:
+        from thenvoi_cli.sdk_client import new_runner
+
+        runner = new_runner()
+        root.obj["runner"] = runner
+        root.call_on_close(runner.close)
+    return runner.run(coro)  # type: ignore[no-any-return]
+
+
+def _get_user_client(ctx: typer.Context) -> AsyncRestClient:
+    """Get the async REST client for the user API key.
+
+    The client is built once per CLI invocation and kept on the root context
+    next to the runner, so its connection pool is reused across requests and
+    closed on the loop it was opened on. Call it from a coroutine passed to
+    _run so the runner already exists.
+    """
+    root = ctx.find_root()
+    root.ensure_object(dict)
+    client: AsyncRestClient | None = root.obj.get("user_client")
+    if client is None:
+        import httpx
+        from thenvoi_rest import AsyncRestClient
+
+        api_key, base_url = _get_user_api_key(), _get_rest_url()
+        http = httpx.AsyncClient(timeout=60)
+        client = AsyncRestClient(api_key=api_key, base_url=base_url, httpx_client=http)
+        root.obj["user_client"] = client
+        # Close callbacks run last-in first-out, so this runs before runner.close
+        runner = root.obj["runner"]
+        root.call_on_close(lambda: runner.run(http.aclose()))
+    return client
 
 
 @app.command("list")
 def list_agents(
-    ctx: typer.Context = typer.Option(None),
+    ctx: typer.Context,
 ) -> None:
     """List all agents you own.
 
@@ -54,17 +92,16 @@ def list_agents(
         thenvoi-cli agents list
         thenvoi-cli agents list --format json
     """
-    import asyncio
-
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _list():
-        client = await _get_user_client()
+        client = _get_user_client(ctx)
         response = await client.human_api.list_my_agents()
         return response.data or []
 
     try:
-        agents = asyncio.run(_list())
+        agents = _run(ctx, _list())
     except MissingEnvironmentError as e:
         console.print(f"[red]Error:[/red] {e.message}")
         console.print(f"[yellow]Hint:[/yellow] {e.hint}")
@@ -81,20 +118,27 @@ def list_agents(
             console.print("[dim]Create one with: thenvoi-cli agents register[/dim]")
         return
 
-    if fmt == OutputFormat.JSON:
-        import json
+    # Every row comes from the same response model, so probe it once
+    get_description: Callable[[Any], str] = (
+        operator.attrgetter("description")
+        if hasattr(agents[0], "description")
+        else lambda agent: ""
+    )
 
+    if fmt == OutputFormat.JSON:
         data = [
             {
                 "id": str(agent.id),
                 "name": agent.name,
-                "description": getattr(agent, "description", ""),
+                "description": get_description(agent),
                 "api_key_masked": mask_api_key(getattr(agent, "api_key", "") or ""),
             }
             for agent in agents
         ]
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
     elif fmt == OutputFormat.TABLE:
+        from rich.table import Table
+
         table = Table(title="Your Agents")
         table.add_column("ID", style="cyan")
         table.add_column("Name")
@@ -104,7 +148,7 @@ def list_agents(
             table.add_row(
                 str(agent.id),
                 agent.name,
-                getattr(agent, "description", "")[:40],
+                (get_description(agent) or "")[:40],
             )
         console.print(table)
     else:  # PLAIN
@@ -114,6 +158,7 @@ def list_agents(
 
 @app.command("register")
 def register_agent(
+    ctx: typer.Context,
     name: str = typer.Option(..., "--name", "-n", help="Agent name"),
     description: str = typer.Option("", "--description", "-d", help="Agent description"),
     save_config: bool = typer.Option(
@@ -121,7 +166,6 @@ def register_agent(
         "--save/--no-save",
         help="Save credentials to agent_config.yaml",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Register a new agent on the platform.
 
@@ -130,12 +174,11 @@ def register_agent(
     Example:
         thenvoi-cli agents register --name "My Bot" --description "A helpful assistant"
     """
-    import asyncio
-
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _register():
-        client = await _get_user_client()
+        client = _get_user_client(ctx)
         from thenvoi_rest import AgentRequest
 
         response = await client.human_api.register_my_agent(
@@ -144,7 +187,7 @@ def register_agent(
         return response.data
 
     try:
-        agent = asyncio.run(_register())
+        agent = _run(ctx, _register())
     except MissingEnvironmentError as e:
         console.print(f"[red]Error:[/red] {e.message}")
         console.print(f"[yellow]Hint:[/yellow] {e.hint}")
@@ -157,13 +200,11 @@ def register_agent(
     api_key = getattr(agent, "api_key", None)
 
     if fmt == OutputFormat.JSON:
-        import json
-
-        console.print(json.dumps({
+        print_json({
             "id": agent_id,
             "name": agent.name,
             "api_key": api_key,  # Show full key in JSON for scripting
-        }, indent=2))
+        })
     else:
         console.print(f"[green]Registered[/green] agent '{agent.name}'")
         console.print(f"[bold]Agent ID:[/bold] {agent_id}")
@@ -190,6 +231,7 @@ def register_agent(
 
 @app.command("delete")
 def delete_agent(
+    ctx: typer.Context,
     agent_id: str = typer.Argument(..., help="Agent ID to delete"),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
@@ -200,19 +242,19 @@ def delete_agent(
     Example:
         thenvoi-cli agents delete 12345678-1234-1234-1234-123456789012
     """
-    import asyncio
-
-    if not force:
+    console = get_console()
+    assume_yes = ctx.obj.get("assume_yes", False) if ctx.obj else False
+    if not force and not assume_yes:
         confirm = typer.confirm(f"Delete agent {agent_id}? This cannot be undone.")
         if not confirm:
             raise typer.Abort()
 
     async def _delete():
-        client = await _get_user_client()
+        client = _get_user_client(ctx)
         await client.human_api.delete_my_agent(id=agent_id, force=True)
 
     try:
-        asyncio.run(_delete())
+        _run(ctx, _delete())
         console.print(f"[green]Deleted[/green] agent {agent_id}")
     except MissingEnvironmentError as e:
         console.print(f"[red]Error:[/red] {e.message}")
@@ -225,9 +267,9 @@ def delete_agent(
 
 @app.command("info")
 def agent_info(
+    ctx: typer.Context,
     agent_id: Optional[str] = typer.Argument(None, help="Agent ID (or uses configured agent)"),
     agent_name: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent name from config"),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Get information about an agent.
 
@@ -237,14 +279,13 @@ def agent_info(
         thenvoi-cli agents info 12345678-1234-1234-1234-123456789012
         thenvoi-cli agents info --agent my-agent
     """
-    import asyncio
+    from thenvoi_cli.config_manager import ConfigManager
 
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     # Resolve agent_id from config if needed
     if not agent_id and agent_name:
-        from thenvoi_cli.config_manager import ConfigManager
-
         manager = ConfigManager()
         agent_id, _ = manager.load_agent(agent_name)
     elif not agent_id:
@@ -257,8 +298,6 @@ def agent_info(
 
         # We need the agent's API key for this
         if agent_name:
-            from thenvoi_cli.config_manager import ConfigManager
-
             manager = ConfigManager()
             _, api_key = manager.load_agent(agent_name)
         else:
@@ -274,7 +313,7 @@ def agent_info(
         return response.data
 
     try:
-        agent = asyncio.run(_info())
+        agent = _run(ctx, _info())
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
@@ -285,14 +324,12 @@ def agent_info(
         return
 
     if fmt == OutputFormat.JSON:
-        import json
-
         data = {
             "id": str(agent.id),
             "name": agent.name,
             "description": getattr(agent, "description", ""),
         }
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
     else:
         console.print(f"[bold]Agent ID:[/bold] {agent.id}")
         console.print(f"[bold]Name:[/bold] {agent.name}")
@@ -0,0 +1,97 @@
+"""Batch command for running several CLI commands in one process."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+from typing import cast
+
+import click
+import typer
+from rich import get_console
+
+
+def _dispatch(root_ctx: click.Context, args: list[str]) -> int:
+    """Run one batch line and return its exit code.
+
+    Lines that start with a subcommand are dispatched under the batch's own
+    root context, so the global options and logging set up for the batch
+    are reused instead of re-parsed. Lines that start with a global option
+    go through the full root command.
+
+    Args:
+        root_ctx: The root context of the batch invocation.
+        args: The line split into arguments.
+
+    Returns:
+        The command's exit code.
+    """
+    group = cast(click.Group, root_ctx.command)
+    if args[0].startswith("-"):
+        # With standalone_mode off, click returns typer.Exit codes
+        exit_code = group.main(args, prog_name="thenvoi-cli", standalone_mode=False)
+        return exit_code if isinstance(exit_code, int) else 0
+
+    name, command, rest = group.resolve_command(root_ctx, args)
+    if command is None or name is None:
+        raise click.UsageError(f"No such command '{args[0]}'.")
+    try:
+        with command.make_context(name, rest, parent=root_ctx) as sub_ctx:
+            command.invoke(sub_ctx)
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    return 0
+
+
+def batch(
+    ctx: typer.Context,
+    keep_going: bool = typer.Option(
+        True,
+        "--keep-going/--stop-on-error",
+        help="Continue with the next command after a failure",
+    ),
+) -> None:
+    """Run CLI commands read from stdin, one per line.
+
+    All commands share one event loop and one connection per agent, so
+    the connection handshake happens once instead of once per command.
+    Blank lines and lines starting with '#' are skipped. Global options
+    given before 'batch' apply to every line; a line may override them by
+    starting with its own global options.
+
+    Example:
+        printf 'rooms list -a my-agent\\nparticipants list ROOM -a my-agent\\n' | thenvoi-cli batch
+    """
+    from thenvoi_cli.sdk_client import sdk_session
+
+    console = get_console()
+    root_ctx = ctx.find_root()
+    failures = 0
+
+    with sdk_session():
+        for lineno, line in enumerate(sys.stdin, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] line {lineno}: {e}")
+                failures += 1
+            else:
+                try:
+                    if _dispatch(root_ctx, args):
+                        failures += 1
+                except click.ClickException as e:
+                    e.show()
+                    failures += 1
+                except click.Abort:
+                    console.print(f"[red]Error:[/red] line {lineno}: aborted")
+                    failures += 1
+
+            if failures and not keep_going:
+                break
+
+    if failures:
+        raise typer.Exit(1)
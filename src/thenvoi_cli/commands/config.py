@@ -5,19 +5,18 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
 from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import AgentNotFoundError, InvalidConfigError
-from thenvoi_cli.output import OutputFormat, mask_api_key, mask_uuid
+from thenvoi_cli.output import OutputFormat, mask_api_key, mask_uuid, print_json, print_lines
 
 app = typer.Typer(help="Manage agent configurations.")
-console = Console()
 
 
 @app.command("set")
 def set_config(
+    ctx: typer.Context,
     name: str = typer.Argument(..., help="Agent name for configuration."),
     agent_id: str = typer.Option(
         ...,
@@ -43,20 +42,26 @@ def set_config(
     Example:
         thenvoi-cli config set my-agent --agent-id abc-123 --api-key sk-...
     """
+    console = get_console()
     manager = ConfigManager()
+    assume_yes = ctx.obj.get("assume_yes", False) if ctx.obj else False
 
-    # Check for existing
-    existing_agents = manager.list_agents()
-    if name in existing_agents and not force:
-        overwrite = typer.confirm(
+    def _confirm_overwrite() -> bool:
+        # abort=True raises typer.Abort when the user declines
+        return typer.confirm(
             f"Agent '{name}' already exists. Overwrite?",
             default=False,
+            abort=True,
         )
-        if not overwrite:
-            raise typer.Abort()
 
     try:
-        is_new = manager.save_agent(name, agent_id, api_key, force=force)
+        is_new = manager.save_agent(
+            name,
+            agent_id,
+            api_key,
+            force=force or assume_yes,
+            on_conflict=_confirm_overwrite,
+        )
         action = "Created" if is_new else "Updated"
         console.print(f"[green]{action}[/green] configuration for '{name}'")
 
@@ -87,9 +92,10 @@ def list_configs(
         thenvoi-cli config list
         thenvoi-cli config list --format json
     """
+    console = get_console()
     fmt = format or ctx.obj.get("format", OutputFormat.TABLE)
     manager = ConfigManager()
-    agents = manager.list_agents()
+    agents = manager.get_all_agent_details()
 
     if not agents:
         if fmt == OutputFormat.JSON:
@@ -100,41 +106,38 @@ def list_configs(
         return
 
     if fmt == OutputFormat.JSON:
-        import json
-
         data = []
-        for name in agents:
-            details = manager.get_agent_details(name)
+        for name, details in agents.items():
             data.append({
                 "name": name,
                 "agent_id": details.get("agent_id"),
                 "api_key_masked": mask_api_key(details.get("api_key", "")),
             })
-        console.print(json.dumps(data, indent=2))
-    elif fmt == OutputFormat.TABLE:
+        print_json(data)
+        return
+
+    rows = [
+        (name, mask_uuid(details.get("agent_id", "")), mask_api_key(details.get("api_key", "")))
+        for name, details in agents.items()
+    ]
+    if fmt == OutputFormat.TABLE:
+        from rich.table import Table
+
         table = Table(title="Configured Agents")
         table.add_column("Name", style="cyan")
         table.add_column("Agent ID")
         table.add_column("API Key")
 
-        for name in agents:
-            details = manager.get_agent_details(name)
-            table.add_row(
-                name,
-                mask_uuid(details.get("agent_id", "")),
-                mask_api_key(details.get("api_key", "")),
-            )
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
     else:  # PLAIN
-        for name in agents:
-            details = manager.get_agent_details(name)
-            console.print(
-                f"{name}: {mask_uuid(details.get('agent_id', ''))} | {mask_api_key(details.get('api_key', ''))}"
-            )
+        print_lines(f"{name}: {agent_id} | {api_key}" for name, agent_id, api_key in rows)
 
 
 @app.command("show")
 def show_config(
+    ctx: typer.Context,
     name: str = typer.Argument(..., help="Agent name to show."),
     reveal: bool = typer.Option(
         False,
@@ -142,7 +145,6 @@ def show_config(
         "-r",
         help="Show full API key (use with caution).",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Show configuration for a specific agent.
 
@@ -150,6 +152,7 @@ def show_config(
         thenvoi-cli config show my-agent
         thenvoi-cli config show my-agent --reveal
     """
+    console = get_console()
     manager = ConfigManager()
 
     try:
@@ -163,16 +166,19 @@ def show_config(
     api_key = details.get("api_key", "")
     displayed_key = api_key if reveal else mask_api_key(api_key)
 
-    console.print(f"[bold]Agent:[/bold] {name}")
-    console.print(f"[bold]Agent ID:[/bold] {details.get('agent_id', '')}")
-    console.print(f"[bold]API Key:[/bold] {displayed_key}")
-
+    lines = [
+        f"[bold]Agent:[/bold] {name}",
+        f"[bold]Agent ID:[/bold] {details.get('agent_id', '')}",
+        f"[bold]API Key:[/bold] {displayed_key}",
+    ]
     if not reveal:
-        console.print("\n[dim]Use --reveal to show full API key[/dim]")
+        lines.append("\n[dim]Use --reveal to show full API key[/dim]")
+    console.print("\n".join(lines))
 
 
 @app.command("delete")
 def delete_config(
+    ctx: typer.Context,
     name: str = typer.Argument(..., help="Agent name to delete."),
     force: bool = typer.Option(
         False,
@@ -187,14 +193,16 @@ def delete_config(
         thenvoi-cli config delete my-agent
         thenvoi-cli config delete my-agent --force
     """
+    console = get_console()
     manager = ConfigManager()
 
     # Check if agent exists
-    if name not in manager.list_agents():
+    if not manager.has_agent(name):
         console.print(f"[red]Error:[/red] Agent '{name}' not found")
         raise typer.Exit(1)
 
-    if not force:
+    assume_yes = ctx.obj.get("assume_yes", False) if ctx.obj else False
+    if not force and not assume_yes:
         confirm = typer.confirm(f"Delete configuration for '{name}'?", default=False)
         if not confirm:
             raise typer.Abort()
@@ -219,6 +227,7 @@ def validate_config(
         thenvoi-cli config validate
         thenvoi-cli config validate my-agent
     """
+    console = get_console()
     manager = ConfigManager()
     errors = manager.validate_config(name)
 
@@ -245,14 +254,16 @@ def show_path() -> None:
     Example:
         thenvoi-cli config path
     """
+    console = get_console()
     manager = ConfigManager()
-    console.print(str(manager.config_path.absolute()))
+    lines = [str(manager.config_path.absolute())]
 
     if manager.config_exists():
-        console.print(f"[dim]File exists: Yes[/dim]")
+        lines.append("[dim]File exists: Yes[/dim]")
         if manager.check_permissions():
-            console.print(f"[dim]Permissions: Secure[/dim]")
+            lines.append("[dim]Permissions: Secure[/dim]")
         else:
-            console.print(f"[yellow]Permissions: Insecure (recommend chmod 600)[/yellow]")
+            lines.append("[yellow]Permissions: Insecure (recommend chmod 600)[/yellow]")
     else:
-        console.print(f"[dim]File exists: No[/dim]")
+        lines.append("[dim]File exists: No[/dim]")
+    console.print("\n".join(lines))
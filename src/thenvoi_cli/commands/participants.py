@@ -5,20 +5,17 @@ from __future__ import annotations
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
-from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import ConfigurationError
-from thenvoi_cli.output import OutputFormat
-from thenvoi_cli.sdk_client import SDKClient, run_async
+from thenvoi_cli.output import OutputFormat, print_json, print_lines
 
 app = typer.Typer(help="Manage room participants.")
-console = Console()
 
 
 @app.command("list")
 def list_participants(
+    ctx: typer.Context,
     room_id: str = typer.Argument(..., help="Room ID to list participants for."),
     agent_name: str = typer.Option(
         ...,
@@ -26,26 +23,21 @@ def list_participants(
         "-a",
         help="Agent to use for the request.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """List participants in a room.
 
     Example:
         thenvoi-cli participants list room-123 --agent my-agent
     """
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _list() -> list:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools(room_id)
             return await tools.get_participants()
-        finally:
-            await client.disconnect()
 
     try:
         participants = run_async(_list())
@@ -64,25 +56,24 @@ def list_participants(
         return
 
     if fmt == OutputFormat.JSON:
-        import json
-
-        console.print(json.dumps(participants, indent=2, default=str))
+        print_json(participants)
     elif fmt == OutputFormat.TABLE:
+        from rich.table import Table
+
         table = Table(title=f"Participants in {room_id}")
         table.add_column("Name", style="cyan")
         table.add_column("Role")
         table.add_column("Type")
 
-        for p in participants:
-            table.add_row(
-                p.get("name", "Unknown"),
-                p.get("role", "member"),
-                p.get("type", ""),
-            )
+        rows = [
+            (p.get("name", "Unknown"), p.get("role", "member"), p.get("type", ""))
+            for p in participants
+        ]
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
     else:  # PLAIN
-        for p in participants:
-            console.print(f"{p.get('name', 'Unknown')} ({p.get('role', 'member')})")
+        print_lines(f"{p.get('name', 'Unknown')} ({p.get('role', 'member')})" for p in participants)
 
 
 @app.command("add")
@@ -108,17 +99,14 @@ def add_participant(
         thenvoi-cli participants add room-123 "Research Bot" --agent my-agent
         thenvoi-cli participants add room-123 "Admin User" --agent my-agent --role admin
     """
-    async def _add() -> dict:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
 
-        await client.connect()
-        try:
+    console = get_console()
+
+    async def _add() -> dict:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools(room_id)
             return await tools.add_participant(name, role=role)
-        finally:
-            await client.disconnect()
 
     try:
         result = run_async(_add())
@@ -133,6 +121,7 @@ def add_participant(
 
 @app.command("remove")
 def remove_participant(
+    ctx: typer.Context,
     room_id: str = typer.Argument(..., help="Room ID to remove participant from."),
     name: str = typer.Argument(..., help="Name of the participant to remove."),
     agent_name: str = typer.Option(
@@ -153,22 +142,19 @@ def remove_participant(
     Example:
         thenvoi-cli participants remove room-123 "Research Bot" --agent my-agent
     """
-    if not force:
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
+    assume_yes = ctx.obj.get("assume_yes", False) if ctx.obj else False
+    if not force and not assume_yes:
         confirm = typer.confirm(f"Remove '{name}' from room {room_id}?", default=False)
         if not confirm:
             raise typer.Abort()
 
     async def _remove() -> dict:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools(room_id)
             return await tools.remove_participant(name)
-        finally:
-            await client.disconnect()
 
     try:
         result = run_async(_remove())
@@ -3,18 +3,14 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
-from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import ConfigurationError
-from thenvoi_cli.output import OutputFormat
-from thenvoi_cli.sdk_client import SDKClient, run_async
-
-console = Console()
+from thenvoi_cli.output import OutputFormat, print_json, print_lines
 
 
 def peers(
+    ctx: typer.Context,
     agent_name: str = typer.Option(
         ...,
         "--agent",
@@ -32,7 +28,6 @@ def peers(
         "--page-size",
         help="Number of results per page.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """List available peers for multi-agent collaboration.
 
@@ -43,19 +38,15 @@ def peers(
         thenvoi-cli peers --agent my-agent --page 2 --page-size 20
         thenvoi-cli peers --agent my-agent --format json
     """
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _peers() -> dict:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools()
             return await tools.lookup_peers(page=page, page_size=page_size)
-        finally:
-            await client.disconnect()
 
     try:
         result = run_async(_peers())
@@ -67,7 +58,7 @@ def peers(
         raise typer.Exit(1)
 
     peers_list = result.get("peers", result.get("data", []))
-    total = result.get("total", len(peers_list))
+    total = result.get("total")
 
     if not peers_list:
         if fmt == OutputFormat.JSON:
@@ -77,26 +68,29 @@ def peers(
         return
 
     if fmt == OutputFormat.JSON:
-        import json
-
-        console.print(json.dumps(result, indent=2, default=str))
+        print_json(result)
     elif fmt == OutputFormat.TABLE:
-        table = Table(title=f"Available Peers (Page {page}, Total: {total})")
+        shown_total = len(peers_list) if total is None else total
+        from rich.table import Table
+
+        table = Table(title=f"Available Peers (Page {page}, Total: {shown_total})")
         table.add_column("Name", style="cyan")
         table.add_column("Description")
         table.add_column("Status")
 
-        for peer in peers_list:
-            table.add_row(
-                peer.get("name", "Unknown"),
-                peer.get("description", "")[:50],
-                peer.get("status", ""),
-            )
+        rows = [
+            (peer.get("name", "Unknown"), peer.get("description", "")[:50], peer.get("status", ""))
+            for peer in peers_list
+        ]
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
 
-        # Show pagination info
-        if len(peers_list) == page_size:
+        # Show pagination info, preferring the server's total over a full-page guess
+        has_more = len(peers_list) == page_size if total is None else page * page_size < total
+        if has_more:
             console.print(f"\n[dim]Use --page {page + 1} to see more[/dim]")
     else:  # PLAIN
-        for peer in peers_list:
-            console.print(f"{peer.get('name', 'Unknown')}: {peer.get('description', '')}")
+        print_lines(
+            f"{peer.get('name', 'Unknown')}: {peer.get('description', '')}" for peer in peers_list
+        )
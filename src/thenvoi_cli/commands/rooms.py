@@ -3,30 +3,26 @@
 from __future__ import annotations
 
 import sys
-from typing import Optional
+from typing import Any, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
-from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import ConfigurationError, ConnectionError
-from thenvoi_cli.output import OutputFormat
-from thenvoi_cli.sdk_client import SDKClient, run_async
+from thenvoi_cli.output import OutputFormat, print_json, print_lines
 
 app = typer.Typer(help="Manage chat rooms.")
-console = Console()
 
 
 @app.command("list")
 def list_rooms(
+    ctx: typer.Context,
     agent_name: str = typer.Option(
         ...,
         "--agent",
         "-a",
         help="Agent to use for the request.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """List rooms the agent has access to.
 
@@ -34,21 +30,42 @@ def list_rooms(
         thenvoi-cli rooms list --agent my-agent
         thenvoi-cli rooms list --agent my-agent --format json
     """
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
-    async def _list() -> list:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
+    # Rooms are rendered as they arrive so only the rows, not every page,
+    # are kept; JSON still needs the whole list for one document
+    rooms: list[dict[str, Any]] = []
+    table = None
+    if fmt == OutputFormat.TABLE:
+        from rich.table import Table
 
-        await client.connect()
-        try:
-            return await client.get_rooms()
-        finally:
-            await client.disconnect()
+        table = Table(title="Rooms")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name")
+        table.add_column("Participants")
+
+    async def _list() -> int:
+        count = 0
+        async with create_sdk_client(agent_name) as client:
+            async for room in client.iter_rooms():
+                count += 1
+                if fmt == OutputFormat.JSON:
+                    rooms.append(room)
+                elif table is not None:
+                    table.add_row(
+                        str(room.get("id", "")),
+                        room.get("name", ""),
+                        str(room.get("participant_count", len(room.get("participants", [])))),
+                    )
+                else:  # PLAIN
+                    print_lines((f"{room.get('id', '')}: {room.get('name', '')}",))
+        return count
 
     try:
-        rooms = run_async(_list())
+        count = run_async(_list())
     except ConfigurationError as e:
         console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(1)
@@ -59,7 +76,7 @@ def list_rooms(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
-    if not rooms:
+    if not count:
         if fmt == OutputFormat.JSON:
             console.print("[]")
         else:
@@ -67,25 +84,9 @@ def list_rooms(
         return
 
     if fmt == OutputFormat.JSON:
-        import json
-
-        console.print(json.dumps(rooms, indent=2, default=str))
-    elif fmt == OutputFormat.TABLE:
-        table = Table(title="Rooms")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name")
-        table.add_column("Participants")
-
-        for room in rooms:
-            table.add_row(
-                str(room.get("id", "")),
-                room.get("name", ""),
-                str(room.get("participant_count", len(room.get("participants", [])))),
-            )
+        print_json(rooms)
+    elif table is not None:
         console.print(table)
-    else:  # PLAIN
-        for room in rooms:
-            console.print(f"{room.get('id', '')}: {room.get('name', '')}")
 
 
 @app.command("send")
@@ -122,22 +123,27 @@ def send_message(
         echo "Long message" | thenvoi-cli rooms send room-123 - --agent my-agent
     """
     # Handle stdin input
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     if message == "-":
-        message = sys.stdin.read().strip()
+        # Read raw bytes and decode once instead of going through the text layer
+        buffer = getattr(sys.stdin, "buffer", None)
+        try:
+            data = buffer.read().decode("utf-8") if buffer else sys.stdin.read()
+        except UnicodeDecodeError as e:
+            console.print(f"[red]Error:[/red] stdin is not valid UTF-8 (byte {e.start})")
+            raise typer.Exit(1) from None
+        message = data.strip()
         if not message:
             console.print("[red]Error:[/red] No message provided via stdin")
             raise typer.Exit(1)
 
     # Parse mentions
-    mention_names = [m.strip() for m in mentions.split(",") if m.strip()]
+    mention_names = [name for name in map(str.strip, mentions.split(",")) if name]
 
     async def _send() -> dict:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools(room_id)
             if msg_type == "message":
                 # Resolve mention names to IDs (workaround for SDK cache bug)
@@ -147,14 +153,13 @@ def send_message(
                 for name in mention_names:
                     pid = name_to_id.get(name)
                     if not pid:
-                        available = list(name_to_id.keys())
-                        raise ValueError(f"Unknown participant '{name}'. Available: {available}")
+                        raise ValueError(
+                            f"Unknown participant '{name}'. Available: {list(name_to_id)}"
+                        )
                     resolved_mentions.append({"id": pid, "name": name})
                 return await tools.send_message(message, mentions=resolved_mentions)
             else:
                 return await tools.send_event(message, message_type=msg_type)
-        finally:
-            await client.disconnect()
 
     try:
         result = run_async(_send())
@@ -170,6 +175,7 @@ def send_message(
 
 @app.command("create")
 def create_room(
+    ctx: typer.Context,
     agent_name: str = typer.Option(
         ...,
         "--agent",
@@ -181,7 +187,6 @@ def create_room(
         "--task-id",
         help="Task ID to associate with the room.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Create a new chat room.
 
@@ -189,27 +194,21 @@ def create_room(
         thenvoi-cli rooms create --agent my-agent
         thenvoi-cli rooms create --agent my-agent --task-id task-456
     """
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _create() -> str:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools()
             return await tools.create_chatroom(task_id=task_id)
-        finally:
-            await client.disconnect()
 
     try:
         room_id = run_async(_create())
 
         if fmt == OutputFormat.JSON:
-            import json
-
-            console.print(json.dumps({"room_id": room_id}))
+            print_json({"room_id": room_id}, indent=False)
         else:
             console.print(f"[green]Created[/green] room: {room_id}")
     except ConfigurationError as e:
@@ -222,6 +221,7 @@ def create_room(
 
 @app.command("info")
 def room_info(
+    ctx: typer.Context,
     room_id: str = typer.Argument(..., help="Room ID to get info for."),
     agent_name: str = typer.Option(
         ...,
@@ -229,45 +229,38 @@ def room_info(
         "-a",
         help="Agent to use for the request.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Get detailed information about a room.
 
     Example:
         thenvoi-cli rooms info room-123 --agent my-agent
     """
+    from thenvoi_cli.sdk_client import create_sdk_client, run_async
+
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     async def _info() -> dict:
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
-        client = SDKClient(agent_id=agent_id, api_key=api_key)
-
-        await client.connect()
-        try:
+        async with create_sdk_client(agent_name) as client:
             tools = client.get_tools(room_id)
             participants = await tools.get_participants()
             return {
                 "room_id": room_id,
                 "participants": participants,
             }
-        finally:
-            await client.disconnect()
 
     try:
         info = run_async(_info())
 
         if fmt == OutputFormat.JSON:
-            import json
-
-            console.print(json.dumps(info, indent=2, default=str))
+            print_json(info)
         else:
-            console.print(f"[bold]Room ID:[/bold] {info['room_id']}")
-            console.print(f"[bold]Participants:[/bold]")
-            for p in info.get("participants", []):
-                name = p.get("name", "Unknown")
-                role = p.get("role", "member")
-                console.print(f"  - {name} ({role})")
+            lines = [f"[bold]Room ID:[/bold] {info['room_id']}", "[bold]Participants:[/bold]"]
+            lines.extend(
+                f"  - {p.get('name', 'Unknown')} ({p.get('role', 'member')})"
+                for p in info.get("participants", [])
+            )
+            console.print("\n".join(lines))
     except ConfigurationError as e:
         console.print(f"[red]Error:[/red] {e.message}")
         raise typer.Exit(1)
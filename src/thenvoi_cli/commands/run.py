@@ -5,11 +5,13 @@ from __future__ import annotations
 import asyncio
 import os
 import signal
+import subprocess
 import sys
+from collections.abc import Callable
 from typing import Optional
 
 import typer
-from rich.console import Console
+from rich import get_console
 
 from thenvoi_cli.adapter_registry import registry
 from thenvoi_cli.config_manager import ConfigManager
@@ -23,10 +25,9 @@ from thenvoi_cli.exceptions import (
 from thenvoi_cli.logging_config import get_logger
 from thenvoi_cli.process_manager import process_manager
 
-console = Console()
-
 
 def run(
+    ctx: typer.Context,
     agent_name: str = typer.Argument(..., help="Agent name from configuration."),
     adapter: str = typer.Option(
         "langgraph",
@@ -62,7 +63,6 @@ def run(
         "--rest-url",
         help="Override REST API URL.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Run an agent connected to the Thenvoi platform.
 
@@ -71,6 +71,7 @@ def run(
         thenvoi-cli run my-agent --adapter anthropic --model claude-sonnet-4-5-20250929
         thenvoi-cli run my-agent --background
     """
+    console = get_console()
     logger = get_logger()
 
     # Load configuration
@@ -83,9 +84,16 @@ def run(
             console.print(f"[yellow]Hint:[/yellow] {e.hint}")
         raise typer.Exit(1)
 
+    # Set only for the process _run_background spawns; drop it so anything the
+    # agent launches does not inherit it
+    background_child = os.environ.pop("THENVOI_BACKGROUND_CHILD", None) == "1"
+
+    # Check every variable against one snapshot of the environment
+    env = dict(os.environ)
+
     # Validate URLs
-    effective_ws_url = ws_url or os.getenv("THENVOI_WS_URL")
-    effective_rest_url = rest_url or os.getenv("THENVOI_REST_URL")
+    effective_ws_url = ws_url or env.get("THENVOI_WS_URL")
+    effective_rest_url = rest_url or env.get("THENVOI_REST_URL")
 
     if not effective_ws_url:
         console.print("[red]Error:[/red] THENVOI_WS_URL not set")
@@ -111,17 +119,20 @@ def run(
         raise typer.Exit(1)
 
     # Check required environment variables for adapter
-    required_env = registry.get_required_env_vars(adapter)
-    for var in required_env:
-        if not os.getenv(var):
-            console.print(f"[red]Error:[/red] Required environment variable '{var}' not set for {adapter} adapter")
-            raise typer.Exit(1)
+    missing_env = [var for var in registry.get_required_env_vars(adapter) if not env.get(var)]
+    if missing_env:
+        names = ", ".join(f"'{var}'" for var in missing_env)
+        console.print(f"[red]Error:[/red] Required environment variable(s) {names} not set for {adapter} adapter")
+        raise typer.Exit(1)
 
     # Get effective model
     effective_model = model or registry.get_default_model(adapter)
 
-    # Check if already running
-    if process_manager.is_running(agent_name):
+    # Check if already running. A background launch pre-registers the PID it
+    # spawned, which is not ours under a PyInstaller onefile bootloader, so the
+    # detached child skips the check and re-registers itself below.
+    running_pid = process_manager.get_pid(agent_name)
+    if running_pid is not None and not background_child:
         console.print(f"[yellow]Warning:[/yellow] Agent '{agent_name}' is already running")
         console.print("Use 'thenvoi-cli stop' to stop it first")
         raise typer.Exit(1)
@@ -163,6 +174,7 @@ def _run_foreground(
     timeout: int,
 ) -> None:
     """Run agent in foreground."""
+    console = get_console()
     logger = get_logger()
 
     console.print(f"Starting agent '[cyan]{agent_name}[/cyan]' with {adapter} adapter...")
@@ -190,19 +202,32 @@ def _run_foreground(
             # Register for cleanup
             process_manager.register_agent(agent_name, os.getpid(), adapter)
 
-            # Set up signal handlers
-            loop = asyncio.get_event_loop()
-
-            def signal_handler() -> None:
-                console.print("\n[yellow]Shutting down...[/yellow]")
-                asyncio.create_task(agent.stop(timeout=timeout))
-
+            # Signals only set the event; repeated Ctrl+C is a no-op instead
+            # of scheduling another stop()
+            stop_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
             for sig in (signal.SIGINT, signal.SIGTERM):
-                loop.add_signal_handler(sig, signal_handler)
+                loop.add_signal_handler(sig, stop_event.set)
 
-            # Run the agent
+            # Run the agent until it exits on its own or a signal arrives
             console.print("[green]Connected[/green] to Thenvoi platform")
-            await agent.run()
+            run_task = asyncio.create_task(agent.run())
+            stop_task = asyncio.create_task(stop_event.wait())
+            await asyncio.wait({run_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+
+            if run_task.done():
+                stop_task.cancel()
+                run_task.result()
+                return
+
+            console.print("\n[yellow]Shutting down...[/yellow]")
+            try:
+                await asyncio.wait_for(agent.stop(timeout=timeout), timeout=timeout + 1)
+            except TimeoutError:
+                logger.warning("Agent did not stop within %ss", timeout)
+            if not run_task.done():
+                run_task.cancel()
+            await asyncio.gather(run_task, return_exceptions=True)
 
         except Exception as e:
             logger.exception("Agent error")
@@ -211,8 +236,11 @@ def _run_foreground(
         finally:
             process_manager.unregister_agent(agent_name)
 
+    from thenvoi_cli.sdk_client import new_runner
+
     try:
-        asyncio.run(_run())
+        with new_runner() as runner:
+            runner.run(_run())
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted[/yellow]")
     finally:
@@ -229,93 +257,127 @@ def _run_background(
     rest_url: str,
     timeout: int,
 ) -> None:
-    """Run agent in background (daemonize)."""
-    # Fork
-    pid = os.fork()
-    if pid > 0:
-        # Parent process
-        console.print(f"Started agent '[cyan]{agent_name}[/cyan]' in background (PID: {pid})")
-        console.print(f"Use 'thenvoi-cli status' to check status")
-        console.print(f"Use 'thenvoi-cli stop {agent_name}' to stop")
-        return
-
-    # Child process - daemonize
-    os.setsid()
-
-    # Fork again
-    pid = os.fork()
-    if pid > 0:
-        os._exit(0)
-
-    # Redirect standard file descriptors
-    sys.stdin.close()
-    sys.stdout.close()
-    sys.stderr.close()
-
-    # Now run the agent
-    _run_foreground(
-        agent_name=agent_name,
-        agent_id=agent_id,
-        api_key=api_key,
-        adapter=adapter,
-        model=model,
-        ws_url=ws_url,
-        rest_url=rest_url,
-        timeout=timeout,
+    """Run agent in background (daemonize).
+
+    Spawns a fresh interpreter running this command in the foreground in a
+    new session, instead of forking the already-initialized CLI process.
+    Credentials are passed through the environment so they stay out of
+    the process list.
+    """
+    console = get_console()
+
+    # A frozen binary is its own entry point; otherwise run the CLI module
+    if getattr(sys, "frozen", False):
+        argv = [sys.executable]
+    else:
+        argv = [sys.executable, "-m", "thenvoi_cli.cli"]
+    argv += [
+        "run", agent_name,
+        "--adapter", adapter,
+        "--timeout", str(timeout),
+        "--ws-url", ws_url,
+        "--rest-url", rest_url,
+    ]
+    if model:
+        argv += ["--model", model]
+
+    env = dict(
+        os.environ,
+        THENVOI_AGENT_ID=agent_id,
+        THENVOI_API_KEY=api_key,
+        THENVOI_BACKGROUND_CHILD="1",
     )
-    os._exit(0)
+    log_file = process_manager.get_log_file(agent_name)
+
+    with open(log_file, "ab") as log:
+        proc = subprocess.Popen(
+            argv,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+            close_fds=True,
+        )
 
+    # Register right away so status sees the agent before the child starts up
+    process_manager.register_agent(agent_name, proc.pid, adapter)
 
-def _create_adapter_instance(
-    adapter_class: type,
-    adapter_name: str,
-    model: str | None,
-) -> object:
-    """Create an adapter instance with appropriate configuration."""
-    # This is a simplified version - real implementation would be more sophisticated
-    if adapter_name == "langgraph":
-        from langchain_openai import ChatOpenAI
-        from langgraph.checkpoint.memory import InMemorySaver
+    console.print(f"Started agent '[cyan]{agent_name}[/cyan]' in background (PID: {proc.pid})")
+    console.print(f"Logs: {log_file}")
+    console.print(f"Use 'thenvoi-cli status' to check status")
+    console.print(f"Use 'thenvoi-cli stop {agent_name}' to stop")
 
-        llm = ChatOpenAI(model=model or "gpt-4o")
-        return adapter_class(llm=llm, checkpointer=InMemorySaver())
 
-    elif adapter_name == "anthropic":
-        return adapter_class(model=model or "claude-sonnet-4-5-20250929")
+def _make_langgraph(adapter_class: type, model: str | None) -> object:
+    """Build a LangGraph adapter around an OpenAI chat model."""
+    from langchain_openai import ChatOpenAI
+    from langgraph.checkpoint.memory import InMemorySaver
 
-    elif adapter_name == "claude-sdk":
-        return adapter_class(model=model or "claude-sonnet-4-5-20250929")
+    llm = ChatOpenAI(model=model or "gpt-4o")
+    return adapter_class(llm=llm, checkpointer=InMemorySaver())
 
-    elif adapter_name == "pydantic-ai":
-        return adapter_class(model=model or "openai:gpt-4o")
 
-    elif adapter_name == "crewai":
-        return adapter_class(
-            model=model or "gpt-4o",
-            role="AI Assistant",
-            goal="Help users with their tasks",
-            backstory="An intelligent AI assistant",
-        )
+def _make_crewai(adapter_class: type, model: str | None) -> object:
+    """Build a CrewAI adapter with a generic assistant persona."""
+    return adapter_class(
+        model=model or "gpt-4o",
+        role="AI Assistant",
+        goal="Help users with their tasks",
+        backstory="An intelligent AI assistant",
+    )
 
-    elif adapter_name == "parlant":
-        return adapter_class(model=model or "gpt-4o")
 
-    elif adapter_name == "a2a":
-        # A2A needs a URL
-        a2a_url = os.getenv("A2A_AGENT_URL")
-        if not a2a_url:
-            raise MissingEnvironmentError("A2A_AGENT_URL")
-        return adapter_class(a2a_url=a2a_url)
+def _make_a2a(adapter_class: type, model: str | None) -> object:
+    """Build an A2A adapter pointed at A2A_AGENT_URL."""
+    a2a_url = os.getenv("A2A_AGENT_URL")
+    if not a2a_url:
+        raise MissingEnvironmentError("A2A_AGENT_URL")
+    return adapter_class(a2a_url=a2a_url)
 
-    elif adapter_name == "a2a-gateway":
-        return adapter_class()
 
-    elif adapter_name == "passthrough":
+def _make_default(adapter_class: type, model: str | None) -> object:
+    """Build an adapter with no dedicated factory."""
+    try:
+        return adapter_class(model=model)
+    except TypeError:
         return adapter_class()
 
-    else:
-        # Default: try to instantiate with model
-        try:
-            return adapter_class(model=model)
-        except TypeError:
-            return adapter_class()
+
+def _with_default_model(default: str) -> Callable[[type, str | None], object]:
+    """Return a factory passing the model, or the given default."""
+
+    def factory(adapter_class: type, model: str | None) -> object:
+        return adapter_class(model=model or default)
+
+    return factory
+
+
+def _without_args(adapter_class: type, model: str | None) -> object:
+    """Build an adapter that takes no configuration."""
+    return adapter_class()
+
+
+# Adapter name -> factory(adapter_class, model); unknown names use _make_default
+_ADAPTER_FACTORIES: dict[str, Callable[[type, str | None], object]] = {
+    "langgraph": _make_langgraph,
+    "anthropic": _with_default_model("claude-sonnet-4-5-20250929"),
+    "claude-sdk": _with_default_model("claude-sonnet-4-5-20250929"),
+    "pydantic-ai": _with_default_model("openai:gpt-4o"),
+    "crewai": _make_crewai,
+    "parlant": _with_default_model("gpt-4o"),
+    "a2a": _make_a2a,
+    "a2a-gateway": _without_args,
+    "passthrough": _without_args,
+}
+
+
+def _create_adapter_instance(
+    adapter_class: type,
+    adapter_name: str,
+    model: str | None,
+) -> object:
+    """Create an adapter instance with appropriate configuration."""
+    # This is a simplified version - real implementation would be more sophisticated
+    factory = _ADAPTER_FACTORIES.get(adapter_name, _make_default)
+    return factory(adapter_class, model)
@@ -6,21 +6,18 @@ from datetime import datetime
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+from rich import get_console
 
-from thenvoi_cli.output import OutputFormat
+from thenvoi_cli.output import OutputFormat, print_json
 from thenvoi_cli.process_manager import process_manager
 
-console = Console()
-
 
 def status(
+    ctx: typer.Context,
     agent_name: Optional[str] = typer.Argument(
         None,
         help="Specific agent to check, or all if not specified.",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Show status of running agents.
 
@@ -29,6 +26,7 @@ def status(
         thenvoi-cli status my-agent
         thenvoi-cli status --format json
     """
+    console = get_console()
     fmt = ctx.obj.get("format", OutputFormat.TABLE) if ctx.obj else OutputFormat.TABLE
 
     if agent_name:
@@ -46,7 +44,7 @@ def status(
             _display_all_status(agents, fmt)
         else:
             if fmt == OutputFormat.JSON:
-                console.print("[]")
+                print_json([])
             else:
                 console.print("No agents running")
                 console.print("[dim]Start one with: thenvoi-cli run <agent-name>[/dim]")
@@ -56,6 +54,8 @@ def _display_single_status(agent: object, fmt: OutputFormat) -> None:
     """Display status for a single agent."""
     from thenvoi_cli.process_manager import AgentProcess
 
+    console = get_console()
+
     if not isinstance(agent, AgentProcess):
         return
 
@@ -63,17 +63,15 @@ def _display_single_status(agent: object, fmt: OutputFormat) -> None:
     uptime_str = _format_uptime(uptime.total_seconds())
 
     if fmt == OutputFormat.JSON:
-        import json
-
         data = {
             "name": agent.name,
             "pid": agent.pid,
             "status": "running",
             "adapter": agent.adapter,
-            "started_at": agent.started_at.isoformat(),
+            "started_at": agent.started_at,
             "uptime_seconds": uptime.total_seconds(),
         }
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
     elif fmt == OutputFormat.TABLE:
         console.print(f"[bold]Agent:[/bold] {agent.name}")
         console.print(f"[bold]Status:[/bold] [green]running[/green]")
@@ -89,23 +87,28 @@ def _display_all_status(agents: list, fmt: OutputFormat) -> None:
     """Display status for all agents."""
     from thenvoi_cli.process_manager import AgentProcess
 
-    if fmt == OutputFormat.JSON:
-        import json
+    console = get_console()
 
+    # One timestamp for the whole listing keeps every row's uptime consistent
+    now = datetime.now()
+
+    if fmt == OutputFormat.JSON:
         data = []
         for agent in agents:
             if isinstance(agent, AgentProcess):
-                uptime = datetime.now() - agent.started_at
+                uptime = now - agent.started_at
                 data.append({
                     "name": agent.name,
                     "pid": agent.pid,
                     "status": "running",
                     "adapter": agent.adapter,
-                    "started_at": agent.started_at.isoformat(),
+                    "started_at": agent.started_at,
                     "uptime_seconds": uptime.total_seconds(),
                 })
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
     elif fmt == OutputFormat.TABLE:
+        from rich.table import Table
+
         table = Table(title="Running Agents")
         table.add_column("Name", style="cyan")
         table.add_column("Status")
@@ -115,7 +118,7 @@ def _display_all_status(agents: list, fmt: OutputFormat) -> None:
 
         for agent in agents:
             if isinstance(agent, AgentProcess):
-                uptime = datetime.now() - agent.started_at
+                uptime = now - agent.started_at
                 table.add_row(
                     agent.name,
                     "[green]running[/green]",
@@ -127,7 +130,7 @@ def _display_all_status(agents: list, fmt: OutputFormat) -> None:
     else:  # PLAIN
         for agent in agents:
             if isinstance(agent, AgentProcess):
-                uptime = datetime.now() - agent.started_at
+                uptime = now - agent.started_at
                 console.print(
                     f"{agent.name}: running (PID {agent.pid}, uptime {_format_uptime(uptime.total_seconds())})"
                 )
@@ -180,8 +183,9 @@ def stop(
         thenvoi-cli stop --all
         thenvoi-cli stop my-agent --force
     """
+    console = get_console()
     if all_agents:
-        count = process_manager.stop_all(force=force)
+        count = process_manager.stop_all(force=force, timeout=timeout)
         if count > 0:
             console.print(f"[green]Stopped[/green] {count} agent(s)")
         else:
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
+from rich import get_console
 
 from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import AgentNotFoundError, InvalidConfigError
 
-console = Console()
+if TYPE_CHECKING:
+    import httpx
 
 
 @dataclass
@@ -26,6 +28,7 @@ class CheckResult:
 
 
 def test(
+    ctx: typer.Context,
     agent_name: str = typer.Argument(..., help="Agent to test."),
     config_only: bool = typer.Option(
         False,
@@ -33,7 +36,6 @@ def test(
         "-c",
         help="Only validate configuration (skip network tests).",
     ),
-    ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Test agent configuration and connectivity.
 
@@ -44,6 +46,7 @@ def test(
         thenvoi-cli test my-agent
         thenvoi-cli test my-agent --config-only
     """
+    console = get_console()
     verbose = ctx.obj.get("verbosity", 0) >= 1 if ctx.obj else False
 
     console.print(f"Testing agent '[cyan]{agent_name}[/cyan]'...\n")
@@ -52,10 +55,22 @@ def test(
 
     # Configuration checks
     console.print("[bold]Configuration:[/bold]")
-    checks.append(_check_config_exists(agent_name))
-    checks.append(_check_agent_exists(agent_name))
-    checks.append(_check_uuid_format(agent_name))
-    checks.append(_check_env_vars())
+    # One manager for every check so the config file is parsed once; each
+    # lookup depends on the previous one, so stop touching the file at the
+    # first failure
+    manager = ConfigManager()
+    config_check = _check_config_exists(manager)
+    agent_check = (
+        _check_agent_exists(agent_name, manager)
+        if config_check.passed
+        else _skipped("Agent config")
+    )
+    uuid_check = (
+        _check_uuid_format(agent_name, manager)
+        if agent_check.passed
+        else _skipped("Agent ID format")
+    )
+    checks.extend((config_check, agent_check, uuid_check, _check_env_vars()))
 
     for check in checks:
         _display_check(check, verbose)
@@ -65,13 +80,12 @@ def test(
         console.print("\n[bold]Connectivity:[/bold]")
         net_checks: list[CheckResult] = []
 
-        # Only run network tests if config passed
-        config_passed = all(c.passed for c in checks if "Config" in c.name or "Agent" in c.name)
-        if config_passed:
-            import asyncio
+        # Only run network tests if config and environment passed
+        if all(c.passed for c in checks):
+            from thenvoi_cli.sdk_client import new_runner
 
-            net_checks.append(asyncio.run(_check_rest_connectivity(agent_name)))
-            net_checks.append(asyncio.run(_check_auth(agent_name)))
+            with new_runner() as runner:
+                net_checks.extend(runner.run(_run_network_checks(agent_name, manager)))
 
             for check in net_checks:
                 _display_check(check, verbose)
@@ -95,15 +109,25 @@ def test(
 
 def _display_check(check: CheckResult, verbose: bool) -> None:
     """Display a check result."""
+    console = get_console()
     status = "[green]PASS[/green]" if check.passed else "[red]FAIL[/red]"
     console.print(f"  {status} {check.name}: {check.message}")
     if verbose and check.details:
         console.print(f"       [dim]{check.details}[/dim]")
 
 
-def _check_config_exists(agent_name: str) -> CheckResult:
+def _skipped(name: str) -> CheckResult:
+    """Build the result for a check skipped because a prerequisite failed."""
+    return CheckResult(
+        name=name,
+        passed=False,
+        message="Skipped",
+        details="Prior check failed",
+    )
+
+
+def _check_config_exists(manager: ConfigManager) -> CheckResult:
     """Check if configuration file exists."""
-    manager = ConfigManager()
     if manager.config_exists():
         return CheckResult(
             name="Config file",
@@ -120,9 +144,8 @@ def _check_config_exists(agent_name: str) -> CheckResult:
         )
 
 
-def _check_agent_exists(agent_name: str) -> CheckResult:
+def _check_agent_exists(agent_name: str, manager: ConfigManager) -> CheckResult:
     """Check if agent is configured."""
-    manager = ConfigManager()
     try:
         manager.load_agent(agent_name)
         return CheckResult(
@@ -145,9 +168,8 @@ def _check_agent_exists(agent_name: str) -> CheckResult:
         )
 
 
-def _check_uuid_format(agent_name: str) -> CheckResult:
+def _check_uuid_format(agent_name: str, manager: ConfigManager) -> CheckResult:
     """Check if agent ID is a valid UUID."""
-    manager = ConfigManager()
     try:
         details = manager.get_agent_details(agent_name)
         agent_id = details.get("agent_id", "")
@@ -194,7 +216,7 @@ def _check_env_vars() -> CheckResult:
         )
 
 
-async def _check_rest_connectivity(agent_name: str) -> CheckResult:
+async def _check_rest_connectivity(http: httpx.AsyncClient) -> CheckResult:
     """Check REST API connectivity."""
     rest_url = os.getenv("THENVOI_REST_URL")
     if not rest_url:
@@ -205,33 +227,33 @@ async def _check_rest_connectivity(agent_name: str) -> CheckResult:
         )
 
     try:
-        import httpx
         import time
 
+        import httpx
+
+        url = f"{rest_url.rstrip('/')}/"
+        # Open the pooled connection first so TCP/TLS setup isn't timed
+        await http.head(url)
+
         start = time.time()
-        async with httpx.AsyncClient() as client:
-            # Try health endpoint or just the base URL
-            response = await client.get(
-                f"{rest_url.rstrip('/')}/",
-                timeout=10.0,
-                follow_redirects=True,
+        # Try health endpoint or just the base URL
+        response = await http.get(url)
+        elapsed = int((time.time() - start) * 1000)
+
+        if response.status_code < 500:
+            return CheckResult(
+                name="REST API",
+                passed=True,
+                message=f"Reachable ({elapsed}ms)",
+                details=rest_url,
+            )
+        else:
+            return CheckResult(
+                name="REST API",
+                passed=False,
+                message=f"Server error (status {response.status_code})",
+                details=rest_url,
             )
-            elapsed = int((time.time() - start) * 1000)
-
-            if response.status_code < 500:
-                return CheckResult(
-                    name="REST API",
-                    passed=True,
-                    message=f"Reachable ({elapsed}ms)",
-                    details=rest_url,
-                )
-            else:
-                return CheckResult(
-                    name="REST API",
-                    passed=False,
-                    message=f"Server error (status {response.status_code})",
-                    details=rest_url,
-                )
     except httpx.ConnectError as e:
         return CheckResult(
             name="REST API",
@@ -248,14 +270,30 @@ async def _check_rest_connectivity(agent_name: str) -> CheckResult:
         )
 
 
-async def _check_auth(agent_name: str) -> CheckResult:
+async def _run_network_checks(agent_name: str, manager: ConfigManager) -> list[CheckResult]:
+    """Run the independent network checks concurrently.
+
+    Both checks catch their own errors, so one failing never cancels the
+    other. The HTTP client is created here and handed to the REST check,
+    which warms its connection before timing a request.
+    """
+    import httpx
+
+    async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as http:
+        return list(
+            await asyncio.gather(
+                _check_rest_connectivity(http),
+                _check_auth(agent_name, manager),
+            )
+        )
+
+
+async def _check_auth(agent_name: str, manager: ConfigManager) -> CheckResult:
     """Check authentication with the platform."""
     try:
-        from thenvoi_cli.config_manager import ConfigManager
         from thenvoi_cli.sdk_client import SDKClient
 
-        config = ConfigManager()
-        agent_id, api_key = config.load_agent(agent_name)
+        agent_id, api_key = manager.load_agent(agent_name)
 
         client = SDKClient(agent_id=agent_id, api_key=api_key)
 
@@ -0,0 +1,14 @@
+"""Optional dependencies shared across thenvoi-cli modules."""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+# Faster JSON encoding from the [fast] extra; None when it isn't installed
+orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:
+    orjson = None
+else:
+    orjson = _orjson
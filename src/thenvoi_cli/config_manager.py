@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import os
-import re
 import stat
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, ClassVar
 
 from thenvoi_cli.exceptions import AgentNotFoundError, InvalidConfigError
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_valid_uuid(value: str) -> bool:
+    """Check that a string is a UUID in the canonical 8-4-4-4-12 layout."""
+    return (
+        len(value) == 36
+        and value.count("-") == 4
+        and value[8] == value[13] == value[18] == value[23] == "-"
+        and _HEX_DIGITS.issuperset(value.replace("-", ""))
+    )
+
 
 class ConfigManager:
     """Manages agent configuration storage and retrieval."""
@@ -19,11 +30,9 @@ class ConfigManager:
     DEFAULT_CONFIG_PATH = Path("agent_config.yaml")
     ENV_CONFIG_PATH = "THENVOI_CONFIG_PATH"
 
-    # UUID regex pattern
-    UUID_PATTERN = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE,
-    )
+    # Parsed config per absolute path, with the (mtime_ns, size) it was read at.
+    # Shared by all instances so separate commands in one process parse once.
+    _parse_cache: ClassVar[dict[Path, tuple[tuple[int, int], dict[str, Any]]]] = {}
 
     def __init__(self, config_path: Path | None = None) -> None:
         """Initialize the configuration manager.
@@ -32,41 +41,93 @@ class ConfigManager:
             config_path: Path to the configuration file. If not provided,
                 uses THENVOI_CONFIG_PATH env var or defaults to agent_config.yaml.
         """
+        env = os.environ
+        env_config_path = env.get(self.ENV_CONFIG_PATH)
         if config_path:
             self.config_path = config_path
-        elif os.getenv(self.ENV_CONFIG_PATH):
-            self.config_path = Path(os.environ[self.ENV_CONFIG_PATH])
+        elif env_config_path:
+            self.config_path = Path(env_config_path)
         else:
             self.config_path = self.DEFAULT_CONFIG_PATH
 
+        # Environment overrides, read once per manager
+        self._env_agent_id = env.get("THENVOI_AGENT_ID")
+        self._env_api_key = env.get("THENVOI_API_KEY")
+        self._env_rest_url = env.get("THENVOI_REST_URL")
+        self._env_ws_url = env.get("THENVOI_WS_URL")
+
+    def _stat(self) -> os.stat_result | None:
+        """Stat the configuration file, or return None if it can't be read."""
+        try:
+            return self.config_path.stat()
+        except OSError:
+            return None
+
     def _load_config(self) -> dict[str, Any]:
-        """Load the configuration file."""
-        if not self.config_path.exists():
+        """Load the configuration file.
+
+        The parsed file is cached per path and reused by every instance
+        until its mtime or size changes, so the YAML is parsed once per
+        process rather than once per lookup.
+        """
+        path = self.config_path.absolute()
+        st = self._stat()
+        if st is None:
+            self._parse_cache.pop(path, None)
             return {}
-        with open(self.config_path) as f:
-            data = yaml.safe_load(f)
-            return data if data else {}
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(path)
+        if cached is None or cached[0] != key:
+            import yaml
+
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            try:
+                text = self.config_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                # Removed between the stat and the read
+                self._parse_cache.pop(path, None)
+                return {}
+            data = yaml.load(text, Loader=loader)
+            cached = (key, data if data else {})
+            self._parse_cache[path] = cached
+        return dict(cached[1])
 
     def _save_config(self, config: dict[str, Any]) -> None:
         """Save the configuration file with secure permissions."""
+        import yaml
+
         # Create parent directories if needed
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write to file
-        with open(self.config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-
-        # Set restrictive permissions (owner read/write only)
-        os.chmod(self.config_path, stat.S_IRUSR | stat.S_IWUSR)
-
-    def _validate_uuid(self, value: str) -> bool:
-        """Validate that a string is a valid UUID."""
-        return bool(self.UUID_PATTERN.match(value))
+        # Write a private temp file then rename it over the config, so readers
+        # never see a partial file and it is never briefly world-readable
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.config_path.parent, prefix=".tmp-", suffix=".yaml"
+        )
+        try:
+            os.fchmod(fd, stat.S_IRUSR | stat.S_IWUSR)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                yaml.dump(config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
+            os.replace(tmp, self.config_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        # Write through so the next load doesn't re-parse what we just wrote
+        st = self.config_path.stat()
+        self._parse_cache[self.config_path.absolute()] = (
+            (st.st_mtime_ns, st.st_size),
+            dict(config),
+        )
 
     def load_agent(self, name: str) -> tuple[str, str]:
         """Load agent credentials from configuration.
 
-        Environment variables take precedence:
+        Environment variables, read when the manager is created, take
+        precedence:
         - THENVOI_AGENT_ID overrides agent_id
         - THENVOI_API_KEY overrides api_key
 
@@ -81,8 +142,8 @@ class ConfigManager:
             InvalidConfigError: If the configuration is invalid.
         """
         # Check for environment variable overrides
-        env_agent_id = os.getenv("THENVOI_AGENT_ID")
-        env_api_key = os.getenv("THENVOI_API_KEY")
+        env_agent_id = self._env_agent_id
+        env_api_key = self._env_api_key
 
         if env_agent_id and env_api_key:
             return env_agent_id, env_api_key
@@ -115,6 +176,7 @@ class ConfigManager:
         api_key: str,
         *,
         force: bool = False,
+        on_conflict: Callable[[], bool] | None = None,
     ) -> bool:
         """Save agent credentials to configuration.
 
@@ -123,26 +185,38 @@ class ConfigManager:
             agent_id: The agent UUID from the Thenvoi platform.
             api_key: The agent API key.
             force: If True, overwrite existing agent without warning.
+            on_conflict: Called when the agent already exists with different
+                credentials and force is False. The existing entry is only
+                replaced if it returns True.
 
         Returns:
-            True if a new agent was created, False if existing was updated.
+            True if a new agent was created, False if existing was updated
+            or on_conflict declined the overwrite.
 
         Raises:
             InvalidConfigError: If the agent_id is not a valid UUID.
         """
-        if not self._validate_uuid(agent_id):
+        if not _is_valid_uuid(agent_id):
             raise InvalidConfigError(
                 f"Invalid agent_id '{agent_id}': must be a valid UUID"
             )
 
         config = self._load_config()
         is_new = name not in config
-
-        config[name] = {
+        entry = {
             "agent_id": agent_id,
             "api_key": api_key,
         }
 
+        # Re-saving identical credentials is a no-op, so skip the prompt and write
+        if not is_new and config[name] == entry:
+            return False
+
+        if not is_new and not force and on_conflict is not None and not on_conflict():
+            return False
+
+        config[name] = entry
+
         self._save_config(config)
         return is_new
 
@@ -173,6 +247,29 @@ class ConfigManager:
         config = self._load_config()
         return list(config.keys())
 
+    def has_agent(self, name: str) -> bool:
+        """Check if an agent is configured.
+
+        Args:
+            name: The agent name.
+
+        Returns:
+            True if the agent exists in configuration.
+        """
+        return name in self._load_config()
+
+    def get_all_agent_details(self) -> dict[str, dict[str, Any]]:
+        """Get details for every configured agent.
+
+        Returns:
+            Dictionary mapping agent name to its configuration.
+        """
+        config = self._load_config()
+        return {
+            name: dict(details) if isinstance(details, dict) else {}
+            for name, details in config.items()
+        }
+
     def get_agent_details(self, name: str) -> dict[str, Any]:
         """Get full details for an agent.
 
@@ -192,6 +289,11 @@ class ConfigManager:
 
         return dict(config[name])
 
+    @staticmethod
+    def _validate_uuid(value: str) -> bool:
+        """Validate that a string is a valid UUID."""
+        return _is_valid_uuid(value)
+
     def validate_config(self, name: str | None = None) -> list[str]:
         """Validate configuration and return list of errors.
 
@@ -204,7 +306,8 @@ class ConfigManager:
         errors: list[str] = []
         config = self._load_config()
 
-        agents_to_check = [name] if name else list(config.keys())
+        agents_to_check = [name] if name else config
+        validate_uuid = _is_valid_uuid
 
         for agent_name in agents_to_check:
             if agent_name not in config:
@@ -222,7 +325,7 @@ class ConfigManager:
 
             if not agent_id:
                 errors.append(f"Agent '{agent_name}': missing 'agent_id'")
-            elif not self._validate_uuid(str(agent_id)):
+            elif not validate_uuid(agent_id if isinstance(agent_id, str) else str(agent_id)):
                 errors.append(f"Agent '{agent_name}': invalid UUID format for 'agent_id'")
 
             if not api_key:
@@ -232,7 +335,7 @@ class ConfigManager:
 
     def config_exists(self) -> bool:
         """Check if the configuration file exists."""
-        return self.config_path.exists()
+        return self._stat() is not None
 
     def check_permissions(self) -> bool:
         """Check if config file has secure permissions.
@@ -240,20 +343,18 @@ class ConfigManager:
         Returns:
             True if permissions are secure (owner-only), False otherwise.
         """
-        if not self.config_path.exists():
+        st = self._stat()
+        if st is None:
             return True
 
-        mode = self.config_path.stat().st_mode
         # Check if group or others have any permissions
-        insecure = mode & (stat.S_IRWXG | stat.S_IRWXO)
+        insecure = st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
         return not insecure
 
     def get_platform_urls(self) -> tuple[str | None, str | None]:
-        """Get platform URLs from environment variables.
+        """Get platform URLs from the environment the manager was created in.
 
         Returns:
             Tuple of (rest_url, ws_url), either may be None if not set.
         """
-        rest_url = os.getenv("THENVOI_REST_URL")
-        ws_url = os.getenv("THENVOI_WS_URL")
-        return rest_url, ws_url
+        return self._env_rest_url, self._env_ws_url
@@ -36,13 +36,14 @@ class ConfigurationError(ThenvoiCLIError):
 class AgentNotFoundError(ConfigurationError):
     """Agent not found in configuration."""
 
+    hint = (
+        "Run 'thenvoi-cli config list' to see available agents, "
+        "or 'thenvoi-cli config set' to add a new agent."
+    )
+
     def __init__(self, agent_name: str) -> None:
         self.agent_name = agent_name
-        super().__init__(
-            f"Agent '{agent_name}' not found in configuration",
-            hint="Run 'thenvoi-cli config list' to see available agents, "
-            "or 'thenvoi-cli config set' to add a new agent.",
-        )
+        super().__init__(f"Agent '{agent_name}' not found in configuration")
 
 
 class InvalidConfigError(ConfigurationError):
@@ -72,13 +73,13 @@ class AuthenticationError(ThenvoiCLIError):
     """Authentication failed."""
 
     exit_code = 3
+    hint = (
+        "Check your API key with 'thenvoi-cli config show <agent>' "
+        "or regenerate it on the Thenvoi platform."
+    )
 
     def __init__(self, message: str = "Authentication failed") -> None:
-        super().__init__(
-            message,
-            hint="Check your API key with 'thenvoi-cli config show <agent>' "
-            "or regenerate it on the Thenvoi platform.",
-        )
+        super().__init__(message)
 
 
 class AdapterError(ThenvoiCLIError):
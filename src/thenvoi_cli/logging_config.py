@@ -6,34 +6,59 @@ import logging
 import os
 import re
 import sys
-from typing import TYPE_CHECKING
-
-from rich.console import Console
-from rich.logging import RichHandler
-
-if TYPE_CHECKING:
-    pass
 
 
 class SanitizingFilter(logging.Filter):
     """Filter to sanitize sensitive data from log records."""
 
-    # Patterns to redact
-    PATTERNS = [
-        (re.compile(r"sk-[a-zA-Z0-9_-]{20,}"), "[REDACTED_API_KEY]"),
-        (re.compile(r"api_key[=:]\s*['\"]?[\w-]+['\"]?", re.I), "api_key=[REDACTED]"),
-        (re.compile(r"password[=:]\s*['\"]?[\w-]+['\"]?", re.I), "password=[REDACTED]"),
-    ]
+    # Everything to redact, as one alternation so each message is scanned once
+    PATTERN = re.compile(
+        r"(?P<api_key>sk-[a-zA-Z0-9_-]{20,})"
+        r"|(?P<api_key_field>(?i:api_key)[=:]\s*['\"]?[\w-]+['\"]?)"
+        r"|(?P<password>(?i:password)[=:]\s*['\"]?[\w-]+['\"]?)"
+    )
+    REPLACEMENTS = {
+        "api_key": "[REDACTED_API_KEY]",
+        "api_key_field": "api_key=[REDACTED]",
+        "password": "password=[REDACTED]",
+    }
+    # Literal text every match must contain (lower-cased), checked before
+    # running the regex at all
+    ANCHORS = ("sk-", "api_key", "password")
+
+    @classmethod
+    def _redact(cls, match: re.Match[str]) -> str:
+        """Return the redaction for whichever pattern matched."""
+        return cls.REPLACEMENTS[match.lastgroup or ""]
 
     def filter(self, record: logging.LogRecord) -> bool:
-        """Sanitize the log record message."""
-        msg = str(record.msg)
-        for pattern, replacement in self.PATTERNS:
-            msg = pattern.sub(replacement, msg)
-        record.msg = msg
+        """Sanitize the log record message.
+
+        Records without secrets are passed through untouched.
+        """
+        if record.args:
+            # Secrets can arrive through %-args too, so check the formatted
+            # message; it replaces msg/args so handlers don't format again
+            try:
+                msg = record.getMessage()
+            except Exception:
+                # Leave the record for the handler to report as usual
+                return True
+            record.msg = msg
+            record.args = None
+        else:
+            msg = str(record.msg)
+
+        lowered = msg.lower()
+        if any(anchor in lowered for anchor in self.ANCHORS):
+            record.msg = self.PATTERN.sub(self._redact, msg)
         return True
 
 
+# Arguments (and stderr stream) the CLI logger was last configured with
+_current_config: tuple[object, ...] | None = None
+
+
 def setup_logging(
     verbosity: int = 0,
     log_file: str | None = None,
@@ -46,9 +71,14 @@ def setup_logging(
         log_file: Optional path to log file.
         no_color: Disable colors. If None, checks NO_COLOR env var.
 
+    Calling it again with the same settings leaves the existing handlers
+    in place instead of rebuilding them.
+
     Returns:
         Configured logger instance.
     """
+    global _current_config
+
     # Determine color setting
     if no_color is None:
         no_color = os.getenv("NO_COLOR") is not None
@@ -64,14 +94,22 @@ def setup_logging(
 
     # Create logger
     logger = logging.getLogger("thenvoi_cli")
+    config = (verbosity, log_file, no_color, sys.stderr)
+    if config == _current_config and logger.handlers:
+        return logger
+
     logger.setLevel(level)
     logger.handlers.clear()
 
-    # Add sanitizing filter
-    logger.addFilter(SanitizingFilter())
+    # Sanitize on the handlers: handler filters run after level gating and
+    # also see records propagated from child loggers
+    sanitizer = SanitizingFilter()
 
     # Console handler
     if not no_color and sys.stderr.isatty():
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         console = Console(stderr=True)
         handler: logging.Handler = RichHandler(
             console=console,
@@ -88,6 +126,7 @@ def setup_logging(
         handler.setFormatter(logging.Formatter(fmt))
 
     handler.setLevel(level)
+    handler.addFilter(sanitizer)
     logger.addHandler(handler)
 
     # File handler if specified
@@ -97,7 +136,7 @@ def setup_logging(
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
         )
-        file_handler.addFilter(SanitizingFilter())
+        file_handler.addFilter(sanitizer)
         logger.addHandler(file_handler)
 
     # Also configure SDK loggers
@@ -106,8 +145,8 @@ def setup_logging(
         sdk_logger.setLevel(level)
         sdk_logger.handlers.clear()
         sdk_logger.addHandler(handler)
-        sdk_logger.addFilter(SanitizingFilter())
 
+    _current_config = config
     return logger
 
 
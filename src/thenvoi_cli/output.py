@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import json
 import os
+import sys
+from collections.abc import Iterable
+from datetime import date
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.table import Table
+from thenvoi_cli.compat import orjson
+
+if TYPE_CHECKING:
+    from rich.console import Console, RenderableType
 
 
 class OutputFormat(str, Enum):
@@ -23,70 +28,99 @@ class OutputFormatter:
     """Handles formatting and displaying output in various formats."""
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        if console is None:
+            from rich.console import Console
+
+            console = Console()
+        self.console = console
         self._no_color = os.getenv("NO_COLOR") is not None
 
-    def format_dict(self, data: dict[str, Any], fmt: OutputFormat) -> str:
-        """Format a dictionary for output."""
+        # Message templates for the color mode, resolved once
+        if self._no_color:
+            self._success_fmt = "OK: {}"
+            self._error_fmt = "Error: {}"
+            self._warning_fmt = "Warning: {}"
+            self._info_fmt = "{}"
+        else:
+            self._success_fmt = "[green]OK:[/green] {}"
+            self._error_fmt = "[red]Error:[/red] {}"
+            self._warning_fmt = "[yellow]Warning:[/yellow] {}"
+            self._info_fmt = "[dim]{}[/dim]"
+
+    def render_dict(self, data: dict[str, Any], fmt: OutputFormat) -> RenderableType:
+        """Build the output for a dictionary: a Table for TABLE, else a string."""
         if fmt == OutputFormat.JSON:
-            return json.dumps(data, indent=2, default=str)
+            return to_json(data)
         elif fmt == OutputFormat.TABLE:
+            from rich.table import Table
+
             table = Table(show_header=True)
             table.add_column("Key", style="cyan")
             table.add_column("Value")
             for key, value in data.items():
                 table.add_row(str(key), str(value))
-            # Capture table as string
-            with self.console.capture() as capture:
-                self.console.print(table)
-            return capture.get()
+            return table
         else:  # PLAIN
             lines = [f"{key}: {value}" for key, value in data.items()]
             return "\n".join(lines)
 
-    def format_list(
+    def format_dict(self, data: dict[str, Any], fmt: OutputFormat) -> str:
+        """Format a dictionary for output."""
+        return self._to_text(self.render_dict(data, fmt))
+
+    def render_list(
         self,
         data: list[dict[str, Any]],
         fmt: OutputFormat,
         headers: list[str] | None = None,
-    ) -> str:
-        """Format a list of dictionaries for output."""
+    ) -> RenderableType:
+        """Build the output for a list: a Table for TABLE, else a string."""
         if not data:
             if fmt == OutputFormat.JSON:
                 return "[]"
             return "No results"
 
         if fmt == OutputFormat.JSON:
-            return json.dumps(data, indent=2, default=str)
+            return to_json(data)
 
         # Infer headers from first item if not provided
         if headers is None:
             headers = list(data[0].keys())
 
         if fmt == OutputFormat.TABLE:
+            from rich.table import Table
+
             table = Table(show_header=True)
             for header in headers:
                 table.add_column(header.replace("_", " ").title(), style="cyan")
             for row in data:
-                table.add_row(*[str(row.get(h, "")) for h in headers])
-            with self.console.capture() as capture:
-                self.console.print(table)
-            return capture.get()
+                values = (row.get(h, "") for h in headers)
+                # Most cells are already strings; only convert the rest
+                table.add_row(*(v if isinstance(v, str) else str(v) for v in values))
+            return table
         else:  # PLAIN
-            lines = []
-            for row in data:
-                parts = [f"{h}: {row.get(h, '')}" for h in headers]
-                lines.append(" | ".join(parts))
-            return "\n".join(lines)
+            return "\n".join(" | ".join(f"{h}: {row.get(h, '')}" for h in headers) for row in data)
+
+    def format_list(
+        self,
+        data: list[dict[str, Any]],
+        fmt: OutputFormat,
+        headers: list[str] | None = None,
+    ) -> str:
+        """Format a list of dictionaries for output."""
+        return self._to_text(self.render_list(data, fmt, headers))
+
+    def _to_text(self, output: RenderableType) -> str:
+        """Render a Table to a string; strings are returned as-is."""
+        if isinstance(output, str):
+            return output
+        with self.console.capture() as capture:
+            self.console.print(output)
+        return capture.get()
 
     def print_dict(self, data: dict[str, Any], fmt: OutputFormat) -> None:
         """Print a formatted dictionary."""
-        output = self.format_dict(data, fmt)
-        if fmt == OutputFormat.TABLE:
-            # Already printed by capture
-            self.console.print(output, highlight=False)
-        else:
-            self.console.print(output, highlight=False)
+        self.console.print(self.render_dict(data, fmt), highlight=False)
 
     def print_list(
         self,
@@ -94,41 +128,97 @@ class OutputFormatter:
         fmt: OutputFormat,
         headers: list[str] | None = None,
     ) -> None:
-        """Print a formatted list."""
-        output = self.format_list(data, fmt, headers)
-        self.console.print(output, highlight=False)
+        """Print a formatted list.
+
+        Tables are printed as renderables, so they are laid out once rather
+        than captured to a string and printed again.
+        """
+        self.console.print(self.render_list(data, fmt, headers), highlight=False)
 
     def success(self, message: str) -> None:
         """Print a success message."""
-        if self._no_color:
-            self.console.print(f"OK: {message}")
-        else:
-            self.console.print(f"[green]OK:[/green] {message}")
+        self.console.print(self._success_fmt.format(message))
 
     def error(self, message: str) -> None:
         """Print an error message."""
-        if self._no_color:
-            self.console.print(f"Error: {message}", style="")
-        else:
-            self.console.print(f"[red]Error:[/red] {message}")
+        self.console.print(self._error_fmt.format(message))
 
     def warning(self, message: str) -> None:
         """Print a warning message."""
-        if self._no_color:
-            self.console.print(f"Warning: {message}")
-        else:
-            self.console.print(f"[yellow]Warning:[/yellow] {message}")
+        self.console.print(self._warning_fmt.format(message))
 
     def info(self, message: str) -> None:
         """Print an info message."""
-        if self._no_color:
-            self.console.print(message)
-        else:
-            self.console.print(f"[dim]{message}[/dim]")
+        self.console.print(self._info_fmt.format(message))
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global ``formatter`` instance on first access."""
+    if name == "formatter":
+        value = globals()["formatter"] = OutputFormatter()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values the stdlib json module has no native support for.
+
+    Dates are written in ISO 8601, matching what orjson emits natively.
+    """
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Stdlib encoders for when orjson isn't installed, keyed by indent and
+# built once instead of on every dumps() call
+_JSON_ENCODERS = {
+    True: json.JSONEncoder(indent=2, default=_json_default),
+    False: json.JSONEncoder(default=_json_default),
+}
+
+
+def to_json(data: Any, *, indent: bool = True) -> str:
+    """Serialize data to JSON, using orjson when it is installed.
+
+    Dates are written in ISO 8601; other values that aren't natively
+    serializable are converted with str().
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        encoded: bytes = orjson.dumps(data, default=_json_default, option=option)
+        return encoded.decode()
+    return _JSON_ENCODERS[indent].encode(data)
+
+
+def print_json(data: Any, *, indent: bool = True) -> None:
+    """Write data as JSON straight to stdout, followed by a newline.
+
+    Machine-readable output skips the Rich console so long values are
+    never wrapped and brackets are never parsed as markup. With orjson
+    installed the encoded bytes go to the binary stdout buffer directly.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        sys.stdout.write(_JSON_ENCODERS[indent].encode(data) + "\n")
+        return
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(data, default=_json_default, option=option))
+    buffer.flush()
+
 
+def print_lines(lines: Iterable[str]) -> None:
+    """Write plain-text lines straight to stdout.
 
-# Global formatter instance
-formatter = OutputFormatter()
+    Used for --format plain so values are written as-is, without Rich
+    markup parsing, highlighting or wrapping.
+    """
+    sys.stdout.writelines(f"{line}\n" for line in lines)
 
 
 def mask_api_key(key: str) -> str:
@@ -140,7 +230,6 @@ def mask_api_key(key: str) -> str:
 
 def mask_uuid(uuid: str) -> str:
     """Mask a UUID, showing only first and last segments."""
-    parts = uuid.split("-")
-    if len(parts) != 5:
+    if uuid.count("-") != 4:
         return uuid
-    return f"{parts[0]}-****-****-****-{parts[4]}"
+    return f"{uuid[: uuid.find('-')]}-****-****-****-{uuid[uuid.rfind('-') + 1 :]}"
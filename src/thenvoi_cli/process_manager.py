@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
 import os
 import signal
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
@@ -32,19 +35,27 @@ class ProcessManager:
         """Initialize the process manager.
 
         Args:
-            state_dir: Directory for storing PID files.
+            state_dir: Directory for storing agent state files.
         """
         self.state_dir = state_dir or self.STATE_DIR
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_state_file(self, agent_name: str) -> Path:
+        """Get the state file path for an agent."""
+        return self.state_dir / f"{agent_name}.state"
+
     def _get_pid_file(self, agent_name: str) -> Path:
-        """Get the PID file path for an agent."""
+        """Get the legacy PID file path for an agent."""
         return self.state_dir / f"{agent_name}.pid"
 
     def _get_info_file(self, agent_name: str) -> Path:
-        """Get the info file path for an agent."""
+        """Get the legacy info file path for an agent."""
         return self.state_dir / f"{agent_name}.info"
 
+    def get_log_file(self, agent_name: str) -> Path:
+        """Get the log file path for a background agent."""
+        return self.state_dir / f"{agent_name}.log"
+
     def _is_process_running(self, pid: int) -> bool:
         """Check if a process with the given PID is running."""
         try:
@@ -53,6 +64,53 @@ class ProcessManager:
         except OSError:
             return False
 
+    def _read_state(self, agent_name: str) -> dict[str, Any] | None:
+        """Read an agent's registration in a single file read.
+
+        Agents registered by older versions have a .pid file plus a .info
+        sidecar instead of a .state file; those are still understood.
+
+        Returns:
+            The state dict (pid, start time, adapter) or None if missing.
+        """
+        try:
+            state = json.loads(self._get_state_file(agent_name).read_text())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            return None
+        else:
+            return state if isinstance(state, dict) else None
+
+        try:
+            state = {"pid": self._get_pid_file(agent_name).read_text().strip()}
+        except OSError:
+            return None
+        try:
+            info = json.loads(self._get_info_file(agent_name).read_text())
+            if isinstance(info, dict):
+                state = {**info, **state}
+        except (OSError, ValueError):
+            pass
+        return state
+
+    def _live_pid(self, agent_name: str, state: dict[str, Any]) -> int | None:
+        """Return the state's PID if that process is running.
+
+        A registration whose process has exited is removed.
+        """
+        try:
+            pid = int(state["pid"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if self._is_process_running(pid):
+            return pid
+
+        # Clean up stale registration
+        self.unregister_agent(agent_name)
+        return None
+
     def register_agent(
         self,
         agent_name: str,
@@ -66,17 +124,16 @@ class ProcessManager:
             pid: The process ID.
             adapter: The adapter being used.
         """
-        pid_file = self._get_pid_file(agent_name)
-        pid_file.write_text(str(pid))
-
-        info_file = self._get_info_file(agent_name)
-        info = {
-            "started_at": datetime.now().isoformat(),
+        state = {
+            "pid": pid,
+            "started_at_ns": time.time_ns(),
             "adapter": adapter,
         }
-        import json
-
-        info_file.write_text(json.dumps(info))
+        # Write then rename so readers never see a partial file
+        state_file = self._get_state_file(agent_name)
+        tmp_file = state_file.with_suffix(".state.tmp")
+        tmp_file.write_text(json.dumps(state))
+        os.replace(tmp_file, state_file)
 
     def unregister_agent(self, agent_name: str) -> None:
         """Unregister an agent.
@@ -84,13 +141,9 @@ class ProcessManager:
         Args:
             agent_name: The agent name.
         """
-        pid_file = self._get_pid_file(agent_name)
-        info_file = self._get_info_file(agent_name)
-
-        if pid_file.exists():
-            pid_file.unlink()
-        if info_file.exists():
-            info_file.unlink()
+        self._get_state_file(agent_name).unlink(missing_ok=True)
+        self._get_pid_file(agent_name).unlink(missing_ok=True)
+        self._get_info_file(agent_name).unlink(missing_ok=True)
 
     def get_pid(self, agent_name: str) -> int | None:
         """Get the PID for a running agent.
@@ -101,20 +154,10 @@ class ProcessManager:
         Returns:
             The PID or None if not running.
         """
-        pid_file = self._get_pid_file(agent_name)
-        if not pid_file.exists():
-            return None
-
-        try:
-            pid = int(pid_file.read_text().strip())
-            if self._is_process_running(pid):
-                return pid
-            else:
-                # Clean up stale PID file
-                self.unregister_agent(agent_name)
-                return None
-        except (ValueError, OSError):
+        state = self._read_state(agent_name)
+        if state is None:
             return None
+        return self._live_pid(agent_name, state)
 
     def is_running(self, agent_name: str) -> bool:
         """Check if an agent is running.
@@ -136,24 +179,25 @@ class ProcessManager:
         Returns:
             AgentProcess or None if not running.
         """
-        pid = self.get_pid(agent_name)
+        state = self._read_state(agent_name)
+        if state is None:
+            return None
+        pid = self._live_pid(agent_name, state)
         if pid is None:
             return None
 
-        info_file = self._get_info_file(agent_name)
-        adapter = None
+        adapter = state.get("adapter")
         started_at = datetime.now()
 
-        if info_file.exists():
-            try:
-                import json
-
-                info = json.loads(info_file.read_text())
-                adapter = info.get("adapter")
-                if "started_at" in info:
-                    started_at = datetime.fromisoformat(info["started_at"])
-            except (json.JSONDecodeError, ValueError):
-                pass
+        # A malformed timestamp just leaves the default in place
+        try:
+            if "started_at_ns" in state:
+                started_at = datetime.fromtimestamp(state["started_at_ns"] / 1e9)
+            elif "started_at" in state:
+                # ISO timestamp written by older versions
+                started_at = datetime.fromisoformat(state["started_at"])
+        except (OverflowError, OSError, ValueError, TypeError):
+            pass
 
         return AgentProcess(
             name=agent_name,
@@ -170,14 +214,47 @@ class ProcessManager:
         """
         agents: list[AgentProcess] = []
 
-        for pid_file in self.state_dir.glob("*.pid"):
-            agent_name = pid_file.stem
+        # One directory pass; legacy .pid registrations are listed
+        # alongside .state ones
+        names: dict[str, None] = {}
+        with os.scandir(self.state_dir) as entries:
+            for entry in entries:
+                stem, _, suffix = entry.name.rpartition(".")
+                if stem and suffix in ("state", "pid"):
+                    names[stem] = None
+
+        for agent_name in names:
             status = self.get_agent_status(agent_name)
             if status:
                 agents.append(status)
 
         return agents
 
+    def _wait_for_exit(self, pids: set[int], timeout: float) -> set[int]:
+        """Wait for processes to exit, polling with exponential backoff.
+
+        Starts at 10ms and doubles up to 0.5s between checks, so a process
+        that exits quickly is noticed almost immediately.
+
+        Args:
+            pids: Processes to wait for.
+            timeout: Seconds to wait in total.
+
+        Returns:
+            The PIDs still running when the timeout expired.
+        """
+        pending = {pid for pid in pids if self._is_process_running(pid)}
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+            pending = {pid for pid in pending if self._is_process_running(pid)}
+        return pending
+
     def stop_agent(
         self,
         agent_name: str,
@@ -204,15 +281,8 @@ class ProcessManager:
             else:
                 os.kill(pid, signal.SIGTERM)
 
-                # Wait for graceful shutdown
-                import time
-
-                for _ in range(timeout):
-                    if not self._is_process_running(pid):
-                        break
-                    time.sleep(1)
-                else:
-                    # Force kill after timeout
+                # Wait for graceful shutdown, then force kill
+                if self._wait_for_exit({pid}, timeout):
                     os.kill(pid, signal.SIGKILL)
 
             self.unregister_agent(agent_name)
@@ -223,20 +293,40 @@ class ProcessManager:
             self.unregister_agent(agent_name)
             return True
 
-    def stop_all(self, force: bool = False) -> int:
+    def stop_all(self, force: bool = False, timeout: int = 30) -> int:
         """Stop all running agents.
 
+        Every agent is signalled first and then waited on together, so the
+        timeout is shared rather than applied to each agent in turn.
+
         Args:
             force: If True, use SIGKILL.
+            timeout: Seconds to wait before force killing (if not force).
 
         Returns:
             Number of agents stopped.
         """
-        count = 0
-        for agent in self.list_running_agents():
-            if self.stop_agent(agent.name, force=force):
-                count += 1
-        return count
+        agents = self.list_running_agents()
+        sig = signal.SIGKILL if force else signal.SIGTERM
+
+        signalled: set[int] = set()
+        for agent in agents:
+            try:
+                os.kill(agent.pid, sig)
+                signalled.add(agent.pid)
+            except OSError:
+                # Process already gone
+                pass
+
+        if not force:
+            # Force kill whatever outlives the shared timeout
+            for pid in self._wait_for_exit(signalled, timeout):
+                with contextlib.suppress(OSError):
+                    os.kill(pid, signal.SIGKILL)
+
+        for agent in agents:
+            self.unregister_agent(agent.name)
+        return len(agents)
 
 
 # Global process manager instance
@@ -3,18 +3,47 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
-from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any, AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import ConnectionError, MissingEnvironmentError
 
+uvloop: ModuleType | None
+try:
+    import uvloop as _uvloop
+except ImportError:
+    uvloop = None
+else:
+    uvloop = _uvloop
+
 if TYPE_CHECKING:
     from thenvoi.platform.link import ThenvoiLink
     from thenvoi.runtime.tools import AgentTools
 
 
+@functools.lru_cache(maxsize=1)
+def _default_urls() -> tuple[str | None, str | None]:
+    """Read the default (ws_url, rest_url) from the environment once per process."""
+    return os.getenv("THENVOI_WS_URL"), os.getenv("THENVOI_REST_URL")
+
+
+def _room_dict(chat: Any) -> dict[str, Any]:
+    """Convert a chat model from the REST API into a room dictionary."""
+    return {
+        "id": chat.id,
+        "name": getattr(chat, "name", ""),
+        "participant_count": getattr(chat, "participant_count", 0),
+    }
+
+
 class SDKClient:
     """Simplified SDK client for CLI operations.
 
@@ -22,6 +51,11 @@ class SDKClient:
     Thenvoi platform without managing low-level connection details.
     """
 
+    __slots__ = ("agent_id", "api_key", "ws_url", "rest_url", "_link", "_tools")
+
+    # Upper bound on room-list pages requested at once
+    ROOM_PAGE_CONCURRENCY = 8
+
     def __init__(
         self,
         agent_id: str,
@@ -39,9 +73,14 @@ class SDKClient:
         """
         self.agent_id = agent_id
         self.api_key = api_key
-        self.ws_url = ws_url or os.getenv("THENVOI_WS_URL")
-        self.rest_url = rest_url or os.getenv("THENVOI_REST_URL")
+        if not (ws_url and rest_url):
+            env_ws_url, env_rest_url = _default_urls()
+            ws_url = ws_url or env_ws_url
+            rest_url = rest_url or env_rest_url
+        self.ws_url = ws_url
+        self.rest_url = rest_url
         self._link: ThenvoiLink | None = None
+        self._tools: dict[str, AgentTools] = {}
 
     def _validate_urls(self) -> None:
         """Validate that required URLs are configured."""
@@ -76,6 +115,7 @@ class SDKClient:
                 pass  # Ignore disconnect errors
             finally:
                 self._link = None
+                self._tools.clear()
 
     @property
     def is_connected(self) -> bool:
@@ -85,6 +125,8 @@ class SDKClient:
     def get_tools(self, room_id: str = "") -> AgentTools:
         """Get AgentTools instance bound to a room.
 
+        Instances are cached per room for the lifetime of the connection.
+
         Args:
             room_id: Room ID to bind tools to. Required for most operations
                 except create_chatroom and lookup_peers.
@@ -98,35 +140,68 @@ class SDKClient:
         if not self._link:
             raise ConnectionError("Not connected to Thenvoi platform")
 
-        from thenvoi.runtime.tools import AgentTools
+        tools = self._tools.get(room_id)
+        if tools is None:
+            from thenvoi.runtime.tools import AgentTools
 
-        # AgentTools needs the REST client from the link, not the link itself
-        return AgentTools(
-            room_id=room_id,
-            rest=self._link.rest,
-        )
+            # AgentTools needs the REST client from the link, not the link itself
+            tools = AgentTools(
+                room_id=room_id,
+                rest=self._link.rest,
+            )
+            self._tools[room_id] = tools
+        return tools
 
-    async def get_rooms(self) -> list[dict[str, Any]]:
-        """Get list of rooms the agent has access to.
+    async def iter_rooms(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield the rooms the agent has access to, one at a time.
 
-        Returns:
-            List of room dictionaries.
+        When the first response reports more than one page, up to
+        ROOM_PAGE_CONCURRENCY later pages are requested ahead while earlier
+        ones are yielded. A further page is only requested once a page has
+        been fully yielded, so at most that many pages are held at once.
+        Rooms are always yielded in page order.
+
+        Yields:
+            Room dictionaries.
         """
         if not self._link:
             raise ConnectionError("Not connected to Thenvoi platform")
 
-        response = await self._link.rest.agent_api.list_agent_chats()
-        if not response.data:
-            return []
+        list_chats = self._link.rest.agent_api.list_agent_chats
+        response = await list_chats()
 
-        return [
-            {
-                "id": chat.id,
-                "name": getattr(chat, "name", ""),
-                "participant_count": getattr(chat, "participant_count", 0),
-            }
-            for chat in response.data
-        ]
+        total_pages = getattr(getattr(response, "meta", None), "total_pages", None)
+        last_page = total_pages if isinstance(total_pages, int) else 1
+        next_page = 2
+        pending: deque[asyncio.Task[Any]] = deque()
+
+        def _prefetch() -> None:
+            nonlocal next_page
+            while next_page <= last_page and len(pending) < self.ROOM_PAGE_CONCURRENCY:
+                pending.append(asyncio.ensure_future(list_chats(page=next_page)))
+                next_page += 1
+
+        try:
+            _prefetch()
+            for chat in response.data or []:
+                yield _room_dict(chat)
+            while pending:
+                response = await pending.popleft()
+                for chat in response.data or []:
+                    yield _room_dict(chat)
+                _prefetch()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_rooms(self) -> list[dict[str, Any]]:
+        """Get list of rooms the agent has access to.
+
+        Returns:
+            List of room dictionaries.
+        """
+        return [room async for room in self.iter_rooms()]
 
     async def health_check(self) -> dict[str, Any]:
         """Perform a health check against the platform.
@@ -147,6 +222,56 @@ class SDKClient:
             return response.json()  # type: ignore[no-any-return]
 
 
+def new_runner() -> asyncio.Runner:
+    """Create an asyncio.Runner, backed by uvloop when it is installed."""
+    return asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None)
+
+
+@dataclass
+class _Session:
+    """Event loop and connected clients shared by commands in a session."""
+
+    runner: asyncio.Runner
+    clients: dict[str, SDKClient] = field(default_factory=dict)
+
+
+_session: ContextVar[_Session | None] = ContextVar("thenvoi_cli_session", default=None)
+
+
+@contextmanager
+def sdk_session() -> Iterator[None]:
+    """Share one event loop and one connection per agent across commands.
+
+    Inside the session, run_async reuses a single event loop and
+    create_sdk_client keeps clients connected until the session ends,
+    so a sequence of commands pays the connection handshake once.
+    """
+    session = _Session(runner=new_runner())
+    token = _session.set(session)
+    try:
+        yield
+    finally:
+        try:
+            for client in session.clients.values():
+                session.runner.run(client.disconnect())
+        finally:
+            _session.reset(token)
+            session.runner.close()
+
+
+async def _connect_client(
+    agent_name: str,
+    config_manager: ConfigManager | None,
+) -> SDKClient:
+    """Create an SDK client from configuration and connect it."""
+    config = config_manager or ConfigManager()
+    agent_id, api_key = config.load_agent(agent_name)
+
+    client = SDKClient(agent_id=agent_id, api_key=api_key)
+    await client.connect()
+    return client
+
+
 @asynccontextmanager
 async def create_sdk_client(
     agent_name: str,
@@ -154,6 +279,9 @@ async def create_sdk_client(
 ) -> AsyncIterator[SDKClient]:
     """Create and connect an SDK client from configuration.
 
+    Within an sdk_session, the connected client is reused by later calls
+    for the same agent and disconnected when the session ends.
+
     Args:
         agent_name: The agent name in configuration.
         config_manager: Optional ConfigManager instance.
@@ -161,11 +289,16 @@ async def create_sdk_client(
     Yields:
         Connected SDKClient instance.
     """
-    config = config_manager or ConfigManager()
-    agent_id, api_key = config.load_agent(agent_name)
+    session = _session.get()
+    if session is not None:
+        client = session.clients.get(agent_name)
+        if client is None:
+            client = await _connect_client(agent_name, config_manager)
+            session.clients[agent_name] = client
+        yield client
+        return
 
-    client = SDKClient(agent_id=agent_id, api_key=api_key)
-    await client.connect()
+    client = await _connect_client(agent_name, config_manager)
     try:
         yield client
     finally:
@@ -177,10 +310,17 @@ def run_async(coro: Any) -> Any:
 
     This is a helper for CLI commands that need to call async SDK methods.
 
+    Inside an sdk_session the session's event loop is reused. The loop
+    is a uvloop loop when uvloop is installed.
+
     Args:
         coro: The coroutine to run.
 
     Returns:
         The coroutine result.
     """
-    return asyncio.run(coro)
+    session = _session.get()
+    if session is not None:
+        return session.runner.run(coro)
+    with new_runner() as runner:
+        return runner.run(coro)
@@ -14,9 +14,30 @@ if TYPE_CHECKING:
     pass
 
 
-@pytest.fixture
+# Canned platform responses shared by the mock fixtures (treat as read-only)
+_ROOMS = [
+    {"id": "room-1", "name": "Test Room 1", "participant_count": 3},
+    {"id": "room-2", "name": "Test Room 2", "participant_count": 2},
+]
+_PARTICIPANTS = [
+    {"name": "User", "role": "member"},
+    {"name": "Bot", "role": "member"},
+]
+_PEERS = {
+    "peers": [
+        {"name": "Agent1", "description": "First agent", "status": "online"},
+        {"name": "Agent2", "description": "Second agent", "status": "offline"},
+    ],
+    "total": 2,
+}
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
-    """Typer CLI runner for testing commands."""
+    """Typer CLI runner for testing commands.
+
+    CliRunner holds no per-invocation state, so one instance is shared.
+    """
     return CliRunner()
 
 
@@ -28,9 +49,9 @@ def temp_config(tmp_path: Path) -> Generator[Path, None, None]:
         yield config_file
 
 
-@pytest.fixture
-def sample_config(temp_config: Path) -> Path:
-    """Create a sample configuration file."""
+@pytest.fixture(scope="session")
+def sample_config_yaml() -> bytes:
+    """Render the sample configuration once per test session."""
     import yaml
 
     config = {
@@ -44,7 +65,14 @@ def sample_config(temp_config: Path) -> Path:
         },
     }
 
-    temp_config.write_text(yaml.dump(config))
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(config, Dumper=dumper).encode()
+
+
+@pytest.fixture
+def sample_config(temp_config: Path, sample_config_yaml: bytes) -> Path:
+    """Create a sample configuration file."""
+    temp_config.write_bytes(sample_config_yaml)
     return temp_config
 
 
@@ -64,8 +92,14 @@ def mock_env_vars() -> Generator[None, None, None]:
         "ANTHROPIC_API_KEY": "sk-test-anthropic-key",
     }
 
-    with patch.dict(os.environ, env_vars):
-        yield
+    from thenvoi_cli.sdk_client import _default_urls
+
+    _default_urls.cache_clear()
+    try:
+        with patch.dict(os.environ, env_vars):
+            yield
+    finally:
+        _default_urls.cache_clear()
 
 
 @pytest.fixture
@@ -76,50 +110,47 @@ def mock_thenvoi_link() -> Generator[MagicMock, None, None]:
         link_instance.connect = AsyncMock()
         link_instance.disconnect = AsyncMock()
         link_instance.rest = MagicMock()
-        link_instance.rest.get_rooms = AsyncMock(return_value=[
-            {"id": "room-1", "name": "Test Room 1", "participant_count": 3},
-            {"id": "room-2", "name": "Test Room 2", "participant_count": 2},
-        ])
+        link_instance.rest.get_rooms = AsyncMock(return_value=_ROOMS)
         mock.return_value = link_instance
         yield mock
 
 
+def _agent_tools_instance() -> MagicMock:
+    """Build an AgentTools stand-in returning the canned responses."""
+    tools_instance = MagicMock()
+    tools_instance.send_message = AsyncMock(return_value={"id": "msg-123"})
+    tools_instance.send_event = AsyncMock(return_value={"id": "event-123"})
+    tools_instance.get_participants = AsyncMock(return_value=_PARTICIPANTS)
+    tools_instance.add_participant = AsyncMock(return_value={"success": True})
+    tools_instance.remove_participant = AsyncMock(return_value={"success": True})
+    tools_instance.create_chatroom = AsyncMock(return_value="room-new-123")
+    tools_instance.lookup_peers = AsyncMock(return_value=_PEERS)
+    return tools_instance
+
+
 @pytest.fixture
 def mock_agent_tools() -> Generator[MagicMock, None, None]:
     """Mock AgentTools for platform operation tests."""
     with patch("thenvoi_cli.sdk_client.AgentTools") as mock:
-        tools_instance = MagicMock()
-        tools_instance.send_message = AsyncMock(return_value={"id": "msg-123"})
-        tools_instance.send_event = AsyncMock(return_value={"id": "event-123"})
-        tools_instance.get_participants = AsyncMock(return_value=[
-            {"name": "User", "role": "member"},
-            {"name": "Bot", "role": "member"},
-        ])
-        tools_instance.add_participant = AsyncMock(return_value={"success": True})
-        tools_instance.remove_participant = AsyncMock(return_value={"success": True})
-        tools_instance.create_chatroom = AsyncMock(return_value="room-new-123")
-        tools_instance.lookup_peers = AsyncMock(return_value={
-            "peers": [
-                {"name": "Agent1", "description": "First agent", "status": "online"},
-                {"name": "Agent2", "description": "Second agent", "status": "offline"},
-            ],
-            "total": 2,
-        })
-        mock.return_value = tools_instance
+        mock.return_value = _agent_tools_instance()
         yield mock
 
 
 @pytest.fixture
-def mock_sdk_client(mock_thenvoi_link: MagicMock, mock_agent_tools: MagicMock) -> Generator[MagicMock, None, None]:
-    """Mock SDKClient combining link and tools mocks."""
-    with patch("thenvoi_cli.commands.rooms.SDKClient") as mock:
-        client_instance = AsyncMock()
-        client_instance.connect = AsyncMock()
-        client_instance.disconnect = AsyncMock()
-        client_instance.get_rooms = AsyncMock(return_value=[
-            {"id": "room-1", "name": "Test Room 1", "participant_count": 3},
-        ])
-        client_instance.get_tools = MagicMock(return_value=mock_agent_tools.return_value)
+def mock_sdk_client() -> Generator[MagicMock, None, None]:
+    """Mock SDKClient whose get_tools returns a canned AgentTools mock.
+
+    SDKClient is replaced wholesale, so no link or AgentTools patch is needed.
+    """
+    from thenvoi_cli.sdk_client import SDKClient
+
+    with patch("thenvoi_cli.sdk_client.SDKClient") as mock:
+        # Spec'd against the real class: async methods become AsyncMocks and
+        # attributes SDKClient doesn't have raise instead of auto-spawning
+        client_instance = MagicMock(spec=SDKClient)
+        client_instance.get_rooms.return_value = _ROOMS[:1]
+        client_instance.iter_rooms.return_value.__aiter__.return_value = _ROOMS[:1]
+        client_instance.get_tools = MagicMock(return_value=_agent_tools_instance())
         mock.return_value = client_instance
         yield mock
 
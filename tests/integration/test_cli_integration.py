@@ -12,12 +12,6 @@ from typer.testing import CliRunner
 from thenvoi_cli.cli import app
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """CLI test runner."""
-    return CliRunner()
-
-
 @pytest.fixture
 def mock_sdk_full():
     """Full SDK mock for integration tests."""
@@ -26,10 +20,11 @@ def mock_sdk_full():
         client.connect = AsyncMock()
         client.disconnect = AsyncMock()
         client.is_connected = True
-        client.get_rooms = AsyncMock(return_value=[
+        client.iter_rooms = MagicMock()
+        client.iter_rooms.return_value.__aiter__.return_value = [
             {"id": "room-1", "name": "Test Room", "participant_count": 3},
             {"id": "room-2", "name": "Dev Room", "participant_count": 2},
-        ])
+        ]
 
         tools = MagicMock()
         tools.send_message = AsyncMock(return_value={"id": "msg-123"})
@@ -71,6 +71,20 @@ class TestAdapterRegistry:
             missing = registry.get_missing_deps("langgraph")
             assert "langgraph" in missing
 
+    def test_get_missing_deps_cached(self) -> None:
+        """Test that dependency probes run once per adapter."""
+        registry = AdapterRegistry()
+
+        with patch(
+            "thenvoi_cli.adapter_registry._is_package_installed",
+            return_value=False,
+        ) as mock_installed:
+            first = registry.get_missing_deps("anthropic")
+            second = registry.get_missing_deps("anthropic")
+
+        assert first == second == ["anthropic"]
+        assert mock_installed.call_count == 1
+
     def test_get_missing_deps_unknown(self) -> None:
         """Test getting missing deps for unknown adapter."""
         registry = AdapterRegistry()
@@ -88,6 +102,17 @@ class TestAdapterRegistry:
             assert exc_info.value.adapter_name == "langgraph"
             assert "langgraph" in exc_info.value.dependencies
 
+    def test_get_adapter_class_cached(self) -> None:
+        """Test that resolved adapter classes are reused."""
+        from thenvoi_cli.adapters.passthrough import PassthroughAdapter
+
+        registry = AdapterRegistry()
+        assert registry.get_adapter_class("passthrough") is PassthroughAdapter
+
+        with patch("thenvoi_cli.adapter_registry.importlib.import_module") as mock_import:
+            assert registry.get_adapter_class("passthrough") is PassthroughAdapter
+            mock_import.assert_not_called()
+
     def test_get_adapter_class_unknown(self) -> None:
         """Test getting class for unknown adapter."""
         registry = AdapterRegistry()
@@ -117,7 +142,7 @@ class TestAdapterRegistry:
         assert "ANTHROPIC_API_KEY" in vars
 
         vars = registry.get_required_env_vars("unknown")
-        assert vars == []
+        assert vars == ()
 
     def test_is_package_installed(self) -> None:
         """Test package installation check."""
@@ -128,6 +153,14 @@ class TestAdapterRegistry:
         # Non-existent package
         assert _is_package_installed("nonexistent_package_xyz_123") is False
 
+    def test_is_package_installed_imported_module(self) -> None:
+        """Test already-imported modules are answered without a spec lookup."""
+        _is_package_installed.cache_clear()
+        with patch("thenvoi_cli.adapter_registry.find_spec") as mock_find_spec:
+            assert _is_package_installed("json") is True
+
+        mock_find_spec.assert_not_called()
+
     def test_all_adapters_have_required_fields(self) -> None:
         """Test that all adapters have required fields."""
         for name, info in ADAPTERS.items():
@@ -135,5 +168,5 @@ class TestAdapterRegistry:
             assert info.class_name
             assert info.module
             assert info.description
-            assert isinstance(info.required_deps, list)
-            assert isinstance(info.env_vars, list)
+            assert isinstance(info.required_deps, tuple)
+            assert isinstance(info.env_vars, tuple)
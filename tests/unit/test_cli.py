@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
-from thenvoi_cli.cli import app
+from thenvoi_cli.cli import LAZY_COMMANDS, app
 
 
 class TestCLIBasics:
@@ -40,107 +44,568 @@ class TestCLIBasics:
         assert result.exit_code == 0
         assert "Usage" in result.stdout
 
+    def test_completion_bash(self, cli_runner: CliRunner) -> None:
+        """Test completion script generation."""
+        result = cli_runner.invoke(app, ["completion", "bash"])
+
+        assert result.exit_code == 0
+        assert "_THENVOI_CLI_COMPLETE" in result.stdout
+
+    def test_completion_unknown_shell(self, cli_runner: CliRunner) -> None:
+        """Test completion with an unsupported shell."""
+        result = cli_runner.invoke(app, ["completion", "tcsh"])
+
+        assert result.exit_code == 1
+        assert "Unknown shell" in result.stdout
+
+    @pytest.mark.parametrize("command", list(LAZY_COMMANDS))
+    def test_lazy_command_help(self, cli_runner: CliRunner, command: str) -> None:
+        """Test that every lazily loaded command resolves."""
+        result = cli_runner.invoke(app, [command, "--help"])
+
+        assert result.exit_code == 0
+        assert "Usage" in result.stdout
+
+    @pytest.mark.parametrize("args", [["--help"], []])
+    def test_root_help_skips_command_imports(
+        self, cli_runner: CliRunner, args: list[str]
+    ) -> None:
+        """Test root help lists every command without importing its module."""
+        import sys
+
+        with patch.dict("sys.modules"):
+            for name in [name for name in sys.modules if name.startswith("thenvoi_cli.commands.")]:
+                del sys.modules[name]
+
+            result = cli_runner.invoke(app, args)
+
+            assert not [name for name in sys.modules if name.startswith("thenvoi_cli.commands.")]
+
+        assert result.exit_code == 0
+        for command, (_, _, short_help) in LAZY_COMMANDS.items():
+            assert command in result.stdout
+            assert short_help in result.stdout
+
+    @pytest.mark.parametrize("command", list(LAZY_COMMANDS))
+    def test_lazy_command_short_help_matches(self, command: str) -> None:
+        """Test the static short help stays in sync with the command's own help."""
+        from thenvoi_cli.cli import _load_command
+
+        assert (_load_command(command).help or "").startswith(LAZY_COMMANDS[command][2])
+
 
 class TestConfigCommands:
     """Tests for config subcommands."""
 
-    def test_config_list_empty(
-        self, cli_runner: CliRunner, temp_config: Path
-    ) -> None:
+    @pytest.fixture
+    def config_manager(self, temp_config: Path) -> Generator[MagicMock, None, None]:
+        """ConfigManager instance mock used by the config commands."""
+        with patch("thenvoi_cli.commands.config.ConfigManager", autospec=True) as mock_cls:
+            mock_cls.return_value.config_path = temp_config
+            yield mock_cls.return_value
+
+    def test_config_list_empty(self, cli_runner: CliRunner, config_manager: MagicMock) -> None:
         """Test config list with no agents."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.list_agents.return_value = []
+        config_manager.get_all_agent_details.return_value = {}
 
-            result = cli_runner.invoke(app, ["config", "list"])
+        result = cli_runner.invoke(app, ["config", "list"])
 
-            assert result.exit_code == 0
-            assert "No agents configured" in result.stdout
+        assert result.exit_code == 0
+        assert "No agents configured" in result.stdout
 
     def test_config_list_with_agents(
-        self, cli_runner: CliRunner, sample_config: Path
+        self, cli_runner: CliRunner, config_manager: MagicMock
     ) -> None:
         """Test config list with agents."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.list_agents.return_value = ["test-agent", "other-agent"]
-            MockManager.return_value.get_agent_details.side_effect = [
-                {"agent_id": "12345678-1234-1234-1234-123456789012", "api_key": "sk-test"},
-                {"agent_id": "87654321-4321-4321-4321-210987654321", "api_key": "sk-other"},
-            ]
+        config_manager.get_all_agent_details.return_value = {
+            "test-agent": {"agent_id": "12345678-1234-1234-1234-123456789012", "api_key": "sk-test"},
+            "other-agent": {"agent_id": "87654321-4321-4321-4321-210987654321", "api_key": "sk-other"},
+        }
 
-            result = cli_runner.invoke(app, ["config", "list"])
+        result = cli_runner.invoke(app, ["config", "list"])
 
-            assert result.exit_code == 0
-            assert "test-agent" in result.stdout
+        assert result.exit_code == 0
+        assert "test-agent" in result.stdout
 
-    def test_config_set(self, cli_runner: CliRunner, temp_config: Path) -> None:
+    def test_config_set(self, cli_runner: CliRunner, config_manager: MagicMock) -> None:
         """Test config set command."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.list_agents.return_value = []
-            MockManager.return_value.save_agent.return_value = True
-            MockManager.return_value.check_permissions.return_value = True
-
-            result = cli_runner.invoke(app, [
-                "config", "set", "new-agent",
-                "--agent-id", "12345678-1234-1234-1234-123456789012",
-                "--api-key", "sk-test-key",
-            ])
+        config_manager.has_agent.return_value = False
+        config_manager.save_agent.return_value = True
+        config_manager.check_permissions.return_value = True
 
-            assert result.exit_code == 0
-            assert "Created" in result.stdout or "new-agent" in result.stdout
+        result = cli_runner.invoke(app, [
+            "config", "set", "new-agent",
+            "--agent-id", "12345678-1234-1234-1234-123456789012",
+            "--api-key", "sk-test-key",
+        ])
 
-    def test_config_show(self, cli_runner: CliRunner, sample_config: Path) -> None:
+        assert result.exit_code == 0
+        assert "Created" in result.stdout or "new-agent" in result.stdout
+
+    def test_config_show(self, cli_runner: CliRunner, config_manager: MagicMock) -> None:
         """Test config show command."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.get_agent_details.return_value = {
-                "agent_id": "12345678-1234-1234-1234-123456789012",
-                "api_key": "sk-test-key-12345",
-            }
+        config_manager.get_agent_details.return_value = {
+            "agent_id": "12345678-1234-1234-1234-123456789012",
+            "api_key": "sk-test-key-12345",
+        }
 
-            result = cli_runner.invoke(app, ["config", "show", "test-agent"])
+        result = cli_runner.invoke(app, ["config", "show", "test-agent"])
 
-            assert result.exit_code == 0
-            assert "12345678" in result.stdout
-            # API key should be masked
-            assert "sk-test-key-12345" not in result.stdout
+        assert result.exit_code == 0
+        assert "12345678" in result.stdout
+        # API key should be masked
+        assert "sk-test-key-12345" not in result.stdout
 
-    def test_config_show_reveal(self, cli_runner: CliRunner, sample_config: Path) -> None:
+    def test_config_show_reveal(self, cli_runner: CliRunner, config_manager: MagicMock) -> None:
         """Test config show with --reveal."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.get_agent_details.return_value = {
-                "agent_id": "12345678-1234-1234-1234-123456789012",
-                "api_key": "sk-test-key-12345",
-            }
+        config_manager.get_agent_details.return_value = {
+            "agent_id": "12345678-1234-1234-1234-123456789012",
+            "api_key": "sk-test-key-12345",
+        }
 
-            result = cli_runner.invoke(app, ["config", "show", "test-agent", "--reveal"])
+        result = cli_runner.invoke(app, ["config", "show", "test-agent", "--reveal"])
 
-            assert result.exit_code == 0
-            assert "sk-test-key-12345" in result.stdout
+        assert result.exit_code == 0
+        assert "sk-test-key-12345" in result.stdout
 
-    def test_config_delete_with_confirm(
+    def test_config_set_overwrite_declined(
         self, cli_runner: CliRunner, sample_config: Path
+    ) -> None:
+        """Test declining the overwrite prompt keeps the existing agent."""
+        result = cli_runner.invoke(
+            app,
+            [
+                "config", "set", "test-agent",
+                "--agent-id", "00000000-0000-0000-0000-000000000000",
+                "--api-key", "sk-new-key",
+            ],
+            input="n\n",
+        )
+
+        assert result.exit_code == 1
+        assert "already exists" in result.stdout
+        assert "sk-new-key" not in sample_config.read_text()
+
+    def test_config_delete_with_confirm(
+        self, cli_runner: CliRunner, config_manager: MagicMock
     ) -> None:
         """Test config delete with confirmation."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.list_agents.return_value = ["test-agent"]
-            MockManager.return_value.delete_agent.return_value = True
+        config_manager.has_agent.return_value = True
+        config_manager.delete_agent.return_value = True
 
-            result = cli_runner.invoke(
-                app, ["config", "delete", "test-agent", "--force"]
-            )
+        result = cli_runner.invoke(
+            app, ["config", "delete", "test-agent", "--force"]
+        )
 
-            assert result.exit_code == 0
-            assert "Deleted" in result.stdout
+        assert result.exit_code == 0
+        assert "Deleted" in result.stdout
+
+    @pytest.mark.parametrize(
+        ("args", "env"),
+        [
+            (["--yes", "config", "delete", "test-agent"], {}),
+            (["config", "delete", "test-agent"], {"THENVOI_ASSUME_YES": "1"}),
+        ],
+    )
+    def test_config_delete_assume_yes(
+        self, cli_runner: CliRunner, config_manager: MagicMock, args: list[str], env: dict[str, str]
+    ) -> None:
+        """Test --yes and THENVOI_ASSUME_YES skip the confirmation prompt."""
+        config_manager.has_agent.return_value = True
+        config_manager.delete_agent.return_value = True
 
-    def test_config_validate(self, cli_runner: CliRunner, sample_config: Path) -> None:
+        result = cli_runner.invoke(app, args, env=env)
+
+        assert result.exit_code == 0
+        assert "Delete configuration" not in result.stdout
+        assert "Deleted" in result.stdout
+
+    def test_config_validate(self, cli_runner: CliRunner, config_manager: MagicMock) -> None:
         """Test config validate command."""
-        with patch("thenvoi_cli.commands.config.ConfigManager") as MockManager:
-            MockManager.return_value.validate_config.return_value = []
-            MockManager.return_value.check_permissions.return_value = True
+        config_manager.validate_config.return_value = []
+        config_manager.check_permissions.return_value = True
+
+        result = cli_runner.invoke(app, ["config", "validate"])
+
+        assert result.exit_code == 0
+        assert "valid" in result.stdout.lower()
+
+
+class TestAgentsCommands:
+    """Tests for agents subcommands."""
+
+    def test_agents_list_json(self, cli_runner: CliRunner) -> None:
+        """Test agents list with JSON output."""
+        client = MagicMock()
+        client.human_api.list_my_agents = AsyncMock(
+            return_value=SimpleNamespace(data=[
+                SimpleNamespace(id="agent-1", name="Bot", description="Helper", api_key=None),
+            ])
+        )
+
+        with patch("thenvoi_cli.commands.agents._get_user_client", return_value=client):
+            result = cli_runner.invoke(app, ["--format", "json", "agents", "list"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data[0]["id"] == "agent-1"
+        assert data[0]["description"] == "Helper"
+
+    def test_agents_user_client_closed_per_invocation(
+        self, cli_runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each invocation builds its own client and closes it on exit."""
+        monkeypatch.setenv("THENVOI_API_KEY_USER", "sk-user-test")
+        monkeypatch.setenv("THENVOI_REST_URL", "https://api.example.com/")
+        clients: list[Any] = []
+
+        def make_client(**kwargs: Any) -> Any:
+            client = SimpleNamespace(
+                http=kwargs["httpx_client"],
+                human_api=SimpleNamespace(
+                    list_my_agents=AsyncMock(return_value=SimpleNamespace(data=[]))
+                ),
+            )
+            clients.append(client)
+            return client
+
+        fake_rest = SimpleNamespace(AsyncRestClient=make_client)
+        with patch.dict("sys.modules", {"thenvoi_rest": fake_rest}):
+            for _ in range(2):
+                result = cli_runner.invoke(app, ["agents", "list"])
+                assert result.exit_code == 0
+
+        assert len(clients) == 2
+        assert all(client.http.is_closed for client in clients)
+
+
+class TestRoomsCommands:
+    """Tests for rooms subcommands."""
+
+    @pytest.fixture
+    def mock_tools(self, mock_sdk_client: MagicMock) -> MagicMock:
+        """Tools of the mocked SDK client, with a two-member roster."""
+        tools = mock_sdk_client.return_value.get_tools.return_value
+        tools.get_participants.return_value = [
+            {"id": "user-1", "name": "User"},
+            {"id": "bot-1", "name": "Bot"},
+        ]
+        return tools
+
+    def test_rooms_list_plain_streams_rooms(
+        self, cli_runner: CliRunner, sample_config: Path, mock_sdk_client: MagicMock
+    ) -> None:
+        """Test plain output is written from the room iterator."""
+        result = cli_runner.invoke(app, ["--format", "plain", "rooms", "list", "-a", "test-agent"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "room-1: Test Room 1\n"
+        mock_sdk_client.return_value.iter_rooms.assert_called_once_with()
+        mock_sdk_client.return_value.get_rooms.assert_not_called()
+
+    def test_rooms_send_resolves_mentions(
+        self, cli_runner: CliRunner, sample_config: Path, mock_tools: MagicMock
+    ) -> None:
+        """Test mention names are resolved to participant IDs."""
+        result = cli_runner.invoke(app, [
+            "rooms", "send", "room-1", "Hi", "-a", "test-agent", "-m", "User,Bot",
+        ])
+
+        assert result.exit_code == 0
+        mock_tools.send_message.assert_awaited_once_with(
+            "Hi",
+            mentions=[{"id": "user-1", "name": "User"}, {"id": "bot-1", "name": "Bot"}],
+        )
+
+    def test_rooms_send_from_stdin(
+        self, cli_runner: CliRunner, sample_config: Path, mock_tools: MagicMock
+    ) -> None:
+        """Test reading the message body from stdin."""
+        result = cli_runner.invoke(
+            app,
+            ["rooms", "send", "room-1", "-", "-a", "test-agent"],
+            input="  multi-line\nmessage é \n",
+        )
+
+        assert result.exit_code == 0
+        mock_tools.send_message.assert_awaited_once_with(
+            "multi-line\nmessage é",
+            mentions=[{"id": "user-1", "name": "User"}],
+        )
+
+    def test_rooms_send_rejects_invalid_utf8_stdin(
+        self, cli_runner: CliRunner, sample_config: Path, mock_tools: MagicMock
+    ) -> None:
+        """Test undecodable stdin is refused instead of posted with replacements."""
+        result = cli_runner.invoke(
+            app,
+            ["rooms", "send", "room-1", "-", "-a", "test-agent"],
+            input=b"caf\xe9\n",
+        )
 
-            result = cli_runner.invoke(app, ["config", "validate"])
+        assert result.exit_code == 1
+        assert "not valid UTF-8" in result.stdout
+        mock_tools.send_message.assert_not_awaited()
+
+    def test_rooms_send_unknown_mention(
+        self, cli_runner: CliRunner, sample_config: Path, mock_tools: MagicMock
+    ) -> None:
+        """Test an unknown mention lists the available participants."""
+        result = cli_runner.invoke(app, [
+            "rooms", "send", "room-1", "Hi", "-a", "test-agent", "-m", "Ghost",
+        ])
+
+        assert result.exit_code == 1
+        assert "Unknown participant 'Ghost'" in result.stdout
+        mock_tools.send_message.assert_not_awaited()
+
+
+class TestPeersCommand:
+    """Tests for the peers command."""
+
+    @pytest.mark.parametrize(
+        ("lookup", "expect_more"),
+        [
+            ({"peers": [{"name": "A"}, {"name": "B"}], "total": 3}, True),
+            ({"peers": [{"name": "A"}, {"name": "B"}], "total": 2}, False),
+            ({"peers": [{"name": "A"}, {"name": "B"}]}, True),
+            ({"peers": [{"name": "A"}]}, False),
+        ],
+    )
+    def test_peers_more_hint(
+        self,
+        cli_runner: CliRunner,
+        sample_config: Path,
+        lookup: dict,
+        expect_more: bool,
+    ) -> None:
+        """Test the next-page hint uses the total when the API reports one."""
+        with patch("thenvoi_cli.sdk_client.SDKClient") as mock_client:
+            tools = MagicMock()
+            tools.lookup_peers = AsyncMock(return_value=lookup)
+            mock_client.return_value.get_tools = MagicMock(return_value=tools)
+            mock_client.return_value.connect = AsyncMock()
+            mock_client.return_value.disconnect = AsyncMock()
+
+            result = cli_runner.invoke(app, ["peers", "-a", "test-agent", "--page-size", "2"])
+
+        assert result.exit_code == 0
+        assert ("--page 2" in result.stdout) is expect_more
+
+
+class TestTestCommand:
+    """Tests for the test command."""
+
+    def test_network_checks_reported(
+        self, cli_runner: CliRunner, sample_config: Path, mock_env_vars: None
+    ) -> None:
+        """Test both connectivity checks run and are reported."""
+        from thenvoi_cli.commands.test import CheckResult
+
+        with patch(
+            "thenvoi_cli.commands.test._check_rest_connectivity",
+            AsyncMock(return_value=CheckResult(name="REST API", passed=True, message="ok")),
+        ), patch(
+            "thenvoi_cli.commands.test._check_auth",
+            AsyncMock(return_value=CheckResult(name="Authentication", passed=False, message="bad")),
+        ):
+            result = cli_runner.invoke(app, ["test", "test-agent"])
+
+        assert result.exit_code == 1
+        assert "REST API" in result.stdout
+        assert "Authentication" in result.stdout
+
+    async def test_rest_check_warms_connection_before_timing(self, mock_env_vars: None) -> None:
+        """Test the timed GET runs after a request that opened the connection."""
+        import httpx
+
+        from thenvoi_cli.commands.test import _check_rest_connectivity
+
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200)
 
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            result = await _check_rest_connectivity(http)
+
+        assert result.passed
+        assert methods == ["HEAD", "GET"]
+
+    def test_missing_config_skips_dependent_checks(
+        self, cli_runner: CliRunner, temp_config: Path, mock_env_vars: None
+    ) -> None:
+        """Test agent lookups are skipped when the config file is missing."""
+        with patch(
+            "thenvoi_cli.commands.test.ConfigManager.load_agent"
+        ) as mock_load, patch(
+            "thenvoi_cli.commands.test._run_network_checks"
+        ) as mock_network:
+            result = cli_runner.invoke(app, ["test", "test-agent"])
+
+        assert result.exit_code == 1
+        assert "Config file: Not found" in result.stdout
+        assert "Agent config: Skipped" in result.stdout
+        assert "Agent ID format: Skipped" in result.stdout
+        assert "3 of 4 checks failed" in result.stdout
+        mock_load.assert_not_called()
+        mock_network.assert_not_called()
+
+
+class TestRunCommand:
+    """Tests for the run command."""
+
+    def test_run_background_spawns_detached(
+        self,
+        cli_runner: CliRunner,
+        sample_config: Path,
+        mock_env_vars: None,
+        mock_process_manager: Any,
+    ) -> None:
+        """Test --background spawns a new session with credentials in the environment."""
+        with patch("thenvoi_cli.commands.run.process_manager", mock_process_manager), patch(
+            "thenvoi_cli.commands.run.registry.is_available", return_value=True
+        ), patch("thenvoi_cli.commands.run.subprocess.Popen") as mock_popen:
+            mock_popen.return_value.pid = 4242
+
+            result = cli_runner.invoke(app, ["run", "test-agent", "-a", "anthropic", "-b"])
+
+        assert result.exit_code == 0
+        assert "PID: 4242" in result.stdout
+
+        argv = mock_popen.call_args.args[0]
+        kwargs = mock_popen.call_args.kwargs
+        assert argv[argv.index("run") + 1] == "test-agent"
+        assert "sk-test-api-key-12345" not in argv
+        assert kwargs["env"]["THENVOI_API_KEY"] == "sk-test-api-key-12345"
+        assert kwargs["start_new_session"] is True
+        assert mock_process_manager._read_state("test-agent")["pid"] == 4242
+        assert kwargs["env"]["THENVOI_BACKGROUND_CHILD"] == "1"
+
+    @pytest.mark.parametrize(("marker", "runs"), [(None, False), ("1", True)])
+    def test_run_background_child_skips_running_check(
+        self,
+        cli_runner: CliRunner,
+        sample_config: Path,
+        mock_env_vars: None,
+        mock_process_manager: Any,
+        marker: str | None,
+        runs: bool,
+    ) -> None:
+        """Test only the marked child runs over a pre-registered PID that is not its own.
+
+        A PyInstaller onefile launch registers the bootloader's PID, so the
+        child cannot match it against os.getpid().
+        """
+        import os
+
+        seen_pids: list[int | None] = []
+
+        class FakeAgent:
+            async def run(self) -> None:
+                seen_pids.append(mock_process_manager.get_pid("test-agent"))
+
+            async def stop(self, timeout: int) -> None:
+                pass
+
+        # A live PID that is not ours, standing in for the bootloader
+        mock_process_manager.register_agent("test-agent", os.getppid(), "anthropic")
+        env = {"THENVOI_BACKGROUND_CHILD": marker} if marker else {}
+        fake_thenvoi = SimpleNamespace(Agent=SimpleNamespace(create=lambda **_: FakeAgent()))
+        with patch("thenvoi_cli.commands.run.process_manager", mock_process_manager), patch(
+            "thenvoi_cli.commands.run.registry.is_available", return_value=True
+        ), patch("thenvoi_cli.commands.run.registry.get_adapter_class"), patch(
+            "thenvoi_cli.commands.run._create_adapter_instance"
+        ), patch.dict("sys.modules", {"thenvoi": fake_thenvoi}), patch.dict("os.environ", env):
+            result = cli_runner.invoke(app, ["run", "test-agent", "-a", "anthropic"])
+
+            assert "THENVOI_BACKGROUND_CHILD" not in os.environ
+
+        if runs:
             assert result.exit_code == 0
-            assert "valid" in result.stdout.lower()
+            assert seen_pids == [os.getpid()]
+        else:
+            assert result.exit_code == 1
+            assert "already running" in result.stdout
+            assert seen_pids == []
+
+    @pytest.mark.parametrize(
+        ("adapter_name", "model", "expected_kwargs"),
+        [
+            ("anthropic", None, {"model": "claude-sonnet-4-5-20250929"}),
+            ("pydantic-ai", "openai:gpt-4o-mini", {"model": "openai:gpt-4o-mini"}),
+            ("passthrough", "ignored", {}),
+            ("unknown-adapter", "some-model", {"model": "some-model"}),
+        ],
+    )
+    def test_create_adapter_instance_dispatch(
+        self, adapter_name: str, model: str | None, expected_kwargs: dict[str, Any]
+    ) -> None:
+        """Test each adapter name is built by its factory."""
+        from thenvoi_cli.commands.run import _create_adapter_instance
+
+        adapter_class = MagicMock()
+
+        _create_adapter_instance(adapter_class, adapter_name, model)
+
+        adapter_class.assert_called_once_with(**expected_kwargs)
+
+    def test_run_reports_all_missing_adapter_env_vars(
+        self, cli_runner: CliRunner, sample_config: Path, mock_env_vars: None
+    ) -> None:
+        """Test every missing adapter variable is named in one error."""
+        with patch(
+            "thenvoi_cli.commands.run.registry.is_available", return_value=True
+        ), patch(
+            "thenvoi_cli.commands.run.registry.get_required_env_vars",
+            return_value=("ANTHROPIC_API_KEY", "EXTRA_KEY", "OTHER_KEY"),
+        ), patch.dict("os.environ", {"EXTRA_KEY": ""}):
+            result = cli_runner.invoke(app, ["run", "test-agent", "-a", "anthropic"])
+
+        assert result.exit_code == 1
+        assert "'EXTRA_KEY', 'OTHER_KEY'" in result.stdout
+        assert "ANTHROPIC_API_KEY" not in result.stdout
+
+    def test_run_foreground_stops_once_on_repeated_signals(
+        self,
+        cli_runner: CliRunner,
+        sample_config: Path,
+        mock_env_vars: None,
+        mock_process_manager: Any,
+    ) -> None:
+        """Test repeated SIGTERMs trigger a single agent.stop()."""
+        import asyncio
+        import os
+        import signal
+
+        class FakeAgent:
+            def __init__(self) -> None:
+                self.stopped = asyncio.Event()
+                self.stop_calls = 0
+
+            async def run(self) -> None:
+                os.kill(os.getpid(), signal.SIGTERM)
+                os.kill(os.getpid(), signal.SIGTERM)
+                await self.stopped.wait()
+
+            async def stop(self, timeout: int) -> None:
+                self.stop_calls += 1
+                self.stopped.set()
+
+        agent = FakeAgent()
+        fake_thenvoi = SimpleNamespace(Agent=SimpleNamespace(create=lambda **_: agent))
+        with patch("thenvoi_cli.commands.run.process_manager", mock_process_manager), patch(
+            "thenvoi_cli.commands.run.registry.is_available", return_value=True
+        ), patch("thenvoi_cli.commands.run.registry.get_adapter_class"), patch(
+            "thenvoi_cli.commands.run._create_adapter_instance"
+        ), patch.dict("sys.modules", {"thenvoi": fake_thenvoi}):
+            result = cli_runner.invoke(app, ["run", "test-agent", "-a", "anthropic"])
+
+        assert result.exit_code == 0
+        assert result.stdout.count("Shutting down") == 1
+        assert agent.stop_calls == 1
+        assert mock_process_manager.get_pid("test-agent") is None
 
 
 class TestStatusCommands:
@@ -156,6 +621,29 @@ class TestStatusCommands:
             assert result.exit_code == 0
             assert "No agents running" in result.stdout
 
+    def test_status_all_uses_one_timestamp(self, cli_runner: CliRunner) -> None:
+        """Test every row's uptime is measured against the same instant."""
+        from datetime import datetime
+
+        from thenvoi_cli.process_manager import AgentProcess
+
+        started = datetime(2024, 1, 1, 12, 0, 0)
+        agents = [
+            AgentProcess(name=name, pid=pid, started_at=started, adapter="passthrough")
+            for name, pid in (("agent-a", 101), ("agent-b", 102))
+        ]
+        with patch("thenvoi_cli.commands.status.process_manager") as mock_pm, \
+                patch("thenvoi_cli.commands.status.datetime") as mock_dt:
+            mock_pm.list_running_agents.return_value = agents
+            mock_dt.now.return_value = datetime(2024, 1, 1, 12, 1, 30)
+
+            result = cli_runner.invoke(app, ["--format", "json", "status"])
+
+            assert result.exit_code == 0
+            data = json.loads(result.stdout)
+            assert [row["uptime_seconds"] for row in data] == [90.0, 90.0]
+            mock_dt.now.assert_called_once()
+
     def test_stop_not_running(self, cli_runner: CliRunner) -> None:
         """Test stopping an agent that's not running."""
         with patch("thenvoi_cli.commands.status.process_manager") as mock_pm:
@@ -192,3 +680,64 @@ class TestAdaptersCommands:
 
         assert result.exit_code == 1
         assert "Unknown adapter" in result.stdout
+
+
+class TestBatchCommand:
+    """Tests for the batch command."""
+
+    def test_batch_runs_each_line(self, cli_runner: CliRunner) -> None:
+        """Test batch runs every non-comment line from stdin."""
+        result = cli_runner.invoke(
+            app,
+            ["batch"],
+            input="# adapters\nadapters list\n\nadapters info langgraph\n",
+        )
+
+        assert result.exit_code == 0
+        assert "anthropic" in result.stdout.lower()
+        assert "gpt-4o" in result.stdout
+
+    def test_batch_inherits_global_options(self, cli_runner: CliRunner) -> None:
+        """Test lines run with the batch's global options unless they set their own."""
+        result = cli_runner.invoke(
+            app,
+            ["--format", "json", "batch"],
+            input="adapters list\n--format plain adapters list\n",
+        )
+
+        assert result.exit_code == 0
+        json_part, _, plain_part = result.stdout.partition("]\n")
+        assert json.loads(json_part + "]")[0]["name"]
+        assert "[" not in plain_part
+
+    def test_batch_reports_failure(self, cli_runner: CliRunner) -> None:
+        """Test batch exits non-zero when a command fails."""
+        result = cli_runner.invoke(
+            app,
+            ["batch"],
+            input="adapters info unknown-adapter\nadapters list\n",
+        )
+
+        assert result.exit_code == 1
+        assert "Unknown adapter" in result.stdout
+        assert "langgraph" in result.stdout.lower()
+
+    def test_batch_reuses_connection(self, cli_runner: CliRunner, sample_config: Path) -> None:
+        """Test commands in a batch share one connected client per agent."""
+        with patch("thenvoi_cli.sdk_client.SDKClient") as mock_client:
+            client = AsyncMock()
+            client.iter_rooms = MagicMock()
+            client.iter_rooms.return_value.__aiter__.return_value = []
+            mock_client.return_value = client
+
+            result = cli_runner.invoke(
+                app,
+                ["batch"],
+                input="rooms list -a test-agent\nrooms list -a test-agent\n",
+            )
+
+        assert result.exit_code == 0
+        assert mock_client.call_count == 1
+        assert client.iter_rooms.call_count == 2
+        client.connect.assert_awaited_once()
+        client.disconnect.assert_awaited_once()
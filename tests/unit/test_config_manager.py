@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -10,6 +11,10 @@ import yaml
 from thenvoi_cli.config_manager import ConfigManager
 from thenvoi_cli.exceptions import AgentNotFoundError, InvalidConfigError
 
+# libyaml-backed loader/dumper when available, as ConfigManager uses
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class TestConfigManager:
     """Tests for ConfigManager class."""
@@ -44,6 +49,19 @@ class TestConfigManager:
         assert agent_id == "env-agent-id"
         assert api_key == "env-api-key"
 
+    def test_env_read_at_construction(
+        self, sample_config: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test environment overrides are captured when the manager is created."""
+        monkeypatch.setenv("THENVOI_REST_URL", "https://rest.example/")
+        monkeypatch.setenv("THENVOI_WS_URL", "wss://ws.example/")
+        manager = ConfigManager(config_path=sample_config)
+        monkeypatch.setenv("THENVOI_AGENT_ID", "late-agent-id")
+        monkeypatch.setenv("THENVOI_API_KEY", "late-api-key")
+
+        assert manager.get_platform_urls() == ("https://rest.example/", "wss://ws.example/")
+        assert manager.load_agent("test-agent")[1] == "sk-test-api-key-12345"
+
     def test_save_agent_new(self, temp_config: Path) -> None:
         """Test saving a new agent."""
         manager = ConfigManager(config_path=temp_config)
@@ -57,10 +75,28 @@ class TestConfigManager:
         assert temp_config.exists()
 
         # Verify the content
-        config = yaml.safe_load(temp_config.read_text())
+        config = yaml.load(temp_config.read_text(), Loader=_LOADER)
         assert "new-agent" in config
         assert config["new-agent"]["agent_id"] == "12345678-1234-1234-1234-123456789012"
 
+    def test_save_is_atomic_and_private(self, sample_config: Path) -> None:
+        """Test saves replace the file with an owner-only copy and clean up."""
+        import stat
+
+        manager = ConfigManager(config_path=sample_config)
+        original = sample_config.read_text()
+
+        with patch("yaml.dump", side_effect=RuntimeError("disk full")), pytest.raises(RuntimeError):
+            manager.save_agent("new", "12345678-1234-1234-1234-123456789012", "k", force=True)
+
+        assert sample_config.read_text() == original
+        assert [p.name for p in sample_config.parent.iterdir()] == [sample_config.name]
+
+        manager.save_agent("new", "12345678-1234-1234-1234-123456789012", "k")
+
+        assert stat.S_IMODE(sample_config.stat().st_mode) == 0o600
+        assert [p.name for p in sample_config.parent.iterdir()] == [sample_config.name]
+
     def test_save_agent_invalid_uuid(self, temp_config: Path) -> None:
         """Test saving with invalid UUID."""
         manager = ConfigManager(config_path=temp_config)
@@ -87,6 +123,54 @@ class TestConfigManager:
         assert agent_id == "00000000-0000-0000-0000-000000000000"
         assert api_key == "sk-updated-key"
 
+    def test_save_agent_conflict_declined(self, sample_config: Path) -> None:
+        """Test on_conflict can keep an existing agent."""
+        manager = ConfigManager(config_path=sample_config)
+        calls = []
+
+        is_new = manager.save_agent(
+            "test-agent",
+            "00000000-0000-0000-0000-000000000000",
+            "sk-updated-key",
+            on_conflict=lambda: calls.append(1) or False,
+        )
+
+        assert is_new is False
+        assert calls == [1]
+        assert manager.load_agent("test-agent")[1] == "sk-test-api-key-12345"
+
+    def test_save_agent_conflict_skipped_for_new(self, temp_config: Path) -> None:
+        """Test on_conflict isn't called for new agents or with force."""
+        manager = ConfigManager(config_path=temp_config)
+
+        def fail() -> bool:
+            raise AssertionError("on_conflict should not be called")
+
+        manager.save_agent("agent", "00000000-0000-0000-0000-000000000000", "k1", on_conflict=fail)
+        manager.save_agent(
+            "agent", "00000000-0000-0000-0000-000000000000", "k2", force=True, on_conflict=fail
+        )
+
+        assert manager.load_agent("agent")[1] == "k2"
+
+    def test_save_agent_unchanged_skips_write(self, sample_config: Path) -> None:
+        """Test re-saving identical credentials neither prompts nor writes."""
+        manager = ConfigManager(config_path=sample_config)
+
+        def fail() -> bool:
+            raise AssertionError("on_conflict should not be called")
+
+        with patch.object(manager, "_save_config") as mock_save:
+            is_new = manager.save_agent(
+                "test-agent",
+                "12345678-1234-1234-1234-123456789012",
+                "sk-test-api-key-12345",
+                on_conflict=fail,
+            )
+
+        assert is_new is False
+        mock_save.assert_not_called()
+
     def test_delete_agent(self, sample_config: Path) -> None:
         """Test deleting an agent."""
         manager = ConfigManager(config_path=sample_config)
@@ -134,7 +218,7 @@ class TestConfigManager:
                 "api_key": "sk-key",
             }
         }
-        temp_config.write_text(yaml.dump(config))
+        temp_config.write_text(yaml.dump(config, Dumper=_DUMPER))
 
         manager = ConfigManager(config_path=temp_config)
         errors = manager.validate_config()
@@ -150,7 +234,7 @@ class TestConfigManager:
                 # missing api_key
             }
         }
-        temp_config.write_text(yaml.dump(config))
+        temp_config.write_text(yaml.dump(config, Dumper=_DUMPER))
 
         manager = ConfigManager(config_path=temp_config)
         errors = manager.validate_config()
@@ -166,6 +250,21 @@ class TestConfigManager:
         assert details["agent_id"] == "12345678-1234-1234-1234-123456789012"
         assert details["api_key"] == "sk-test-api-key-12345"
 
+    def test_has_agent(self, sample_config: Path) -> None:
+        """Test agent existence check."""
+        manager = ConfigManager(config_path=sample_config)
+
+        assert manager.has_agent("test-agent") is True
+        assert manager.has_agent("nonexistent") is False
+
+    def test_get_all_agent_details(self, sample_config: Path) -> None:
+        """Test getting details for all agents."""
+        manager = ConfigManager(config_path=sample_config)
+        agents = manager.get_all_agent_details()
+
+        assert set(agents) == {"test-agent", "another-agent"}
+        assert agents["another-agent"]["api_key"] == "sk-another-api-key-67890"
+
     def test_config_exists(self, temp_config: Path, sample_config: Path) -> None:
         """Test checking if config exists."""
         # With content
@@ -203,3 +302,57 @@ class TestConfigManager:
         assert manager._validate_uuid("not-a-uuid") is False
         assert manager._validate_uuid("12345678-1234-1234-1234") is False
         assert manager._validate_uuid("") is False
+        assert manager._validate_uuid("12345678-1234-1234-1234-123456789012\n") is False
+        assert manager._validate_uuid("1234567-81234-1234-1234-123456789012") is False
+        assert manager._validate_uuid("g2345678-1234-1234-1234-123456789012") is False
+        assert manager._validate_uuid("12345678-1234-1234-1234-12345678901-") is False
+
+    def test_load_config_cached(self, sample_config: Path) -> None:
+        """Test that repeated lookups parse the file once."""
+        manager = ConfigManager(config_path=sample_config)
+
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            manager.list_agents()
+            manager.get_agent_details("test-agent")
+            manager.load_agent("another-agent")
+
+        assert mock_load.call_count == 1
+
+    def test_load_config_shared_across_instances(self, sample_config: Path) -> None:
+        """Test that separate managers for one file share the parsed config."""
+        with patch("yaml.load", wraps=yaml.load) as mock_load:
+            ConfigManager(config_path=sample_config).list_agents()
+            ConfigManager(config_path=sample_config).load_agent("test-agent")
+
+        assert mock_load.call_count == 1
+
+    def test_round_trip_without_libyaml(
+        self, temp_config: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the pure-Python loader and dumper are used when libyaml is missing."""
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        monkeypatch.delattr(yaml, "CSafeDumper", raising=False)
+        manager = ConfigManager(config_path=temp_config)
+        manager.save_agent("agent", "12345678-1234-1234-1234-123456789012", "sk-key")
+        ConfigManager._parse_cache.clear()
+
+        assert manager.load_agent("agent") == ("12345678-1234-1234-1234-123456789012", "sk-key")
+
+    def test_load_config_reloads_on_change(self, sample_config: Path) -> None:
+        """Test that external edits invalidate the cache."""
+        manager = ConfigManager(config_path=sample_config)
+        assert len(manager.list_agents()) == 2
+
+        sample_config.write_text(
+            yaml.dump(
+                {
+                    "only-agent": {
+                        "agent_id": "12345678-1234-1234-1234-123456789012",
+                        "api_key": "sk-only",
+                    },
+                },
+                Dumper=_DUMPER,
+            )
+        )
+
+        assert manager.list_agents() == ["only-agent"]
@@ -0,0 +1,119 @@
+"""Tests for logging configuration."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from thenvoi_cli.logging_config import SanitizingFilter, setup_logging
+
+
+def _record(msg: object, *args: object) -> logging.LogRecord:
+    """Build a log record for the filter."""
+    return logging.LogRecord("thenvoi_cli", logging.INFO, __file__, 1, msg, args or None, None)
+
+
+class TestSanitizingFilter:
+    """Tests for SanitizingFilter."""
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("key sk-abcdefghijklmnopqrstuvwxyz", "key [REDACTED_API_KEY]"),
+            ("API_KEY: 'secret-value'", "api_key=[REDACTED]"),
+            ("login password=hunter2 ok", "login password=[REDACTED] ok"),
+            (
+                "sk-abcdefghijklmnopqrstuvwxyz and Password: pw1",
+                "[REDACTED_API_KEY] and password=[REDACTED]",
+            ),
+            ("nothing sensitive here", "nothing sensitive here"),
+        ],
+    )
+    def test_redacts_secrets(self, message: str, expected: str) -> None:
+        """Test each kind of secret is replaced with its redaction."""
+        record = _record(message)
+
+        assert SanitizingFilter().filter(record) is True
+        assert record.getMessage() == expected
+
+    def test_short_sk_prefix_kept(self) -> None:
+        """Test short sk- tokens are not treated as API keys."""
+        record = _record("task sk-123 done")
+
+        SanitizingFilter().filter(record)
+
+        assert record.getMessage() == "task sk-123 done"
+
+    def test_regex_skipped_without_anchor(self) -> None:
+        """Test messages without any secret keyword never reach the regex."""
+        with patch.object(SanitizingFilter, "PATTERN") as mock_pattern:
+            SanitizingFilter().filter(_record("connected to room-1"))
+
+        mock_pattern.sub.assert_not_called()
+
+    def test_redacts_secrets_in_args(self) -> None:
+        """Test secrets passed as %-style arguments are redacted too."""
+        record = _record("using key %s for %s", "sk-abcdefghijklmnopqrstuvwxyz", "agent")
+
+        SanitizingFilter().filter(record)
+
+        assert record.getMessage() == "using key [REDACTED_API_KEY] for agent"
+        assert record.args is None
+
+    def test_non_string_message_untouched(self) -> None:
+        """Test a clean non-string message isn't converted to str."""
+        payload = {"room": "room-1"}
+        record = _record(payload)
+
+        SanitizingFilter().filter(record)
+
+        assert record.msg is payload
+
+    def test_bad_format_args_left_for_handler(self) -> None:
+        """Test a formatting error doesn't escape the filter."""
+        record = _record("%d rooms", "not-a-number")
+
+        assert SanitizingFilter().filter(record) is True
+        assert record.args == ("not-a-number",)
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Forget the previous configuration so each test builds fresh handlers."""
+        monkeypatch.setattr("thenvoi_cli.logging_config._current_config", None)
+
+    def test_child_logger_records_sanitized(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test records propagated from child loggers are sanitized by the handler."""
+        setup_logging(verbosity=1, no_color=True)
+
+        logging.getLogger("thenvoi_cli.commands").info("key %s", "sk-abcdefghijklmnopqrstuvwxyz")
+
+        err = capsys.readouterr().err
+        assert "[REDACTED_API_KEY]" in err
+        assert "sk-abcdefghijklmnopqrstuvwxyz" not in err
+
+    def test_filters_attached_to_handlers_only(self) -> None:
+        """Test no logger carries its own sanitizing filter."""
+        logger = setup_logging(verbosity=0, no_color=True)
+
+        assert logger.filters == []
+        assert all(
+            any(isinstance(f, SanitizingFilter) for f in handler.filters)
+            for handler in logger.handlers
+        )
+
+    def test_repeat_call_keeps_handlers(self) -> None:
+        """Test calling again with the same settings reuses the existing handlers."""
+        logger = setup_logging(verbosity=1, no_color=True)
+        handlers = list(logger.handlers)
+
+        assert setup_logging(verbosity=1, no_color=True) is logger
+        assert logger.handlers == handlers
+
+        setup_logging(verbosity=2, no_color=True)
+        assert logger.handlers != handlers
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
+import sys
+from collections.abc import Callable
 from unittest.mock import patch
 
 import pytest
@@ -13,69 +16,197 @@ from thenvoi_cli.output import (
     OutputFormatter,
     mask_api_key,
     mask_uuid,
+    print_json,
+    print_lines,
+    to_json,
 )
 
 
+@pytest.fixture(scope="module")
+def formatter() -> OutputFormatter:
+    """Formatter shared by tests that only format to strings."""
+    return OutputFormatter()
+
+
 class TestOutputFormatter:
     """Tests for OutputFormatter class."""
 
-    def test_format_dict_json(self) -> None:
-        """Test formatting dict as JSON."""
-        formatter = OutputFormatter()
-        data = {"key": "value", "number": 42}
+    @pytest.mark.parametrize(
+        ("fmt", "check"),
+        [
+            (OutputFormat.JSON, lambda out: json.loads(out) == {"key": "value", "number": 42}),
+            (OutputFormat.PLAIN, lambda out: "key: value" in out and "number: 42" in out),
+        ],
+        ids=["json", "plain"],
+    )
+    def test_format_dict(
+        self, formatter: OutputFormatter, fmt: OutputFormat, check: Callable[[str], bool]
+    ) -> None:
+        """Test formatting a dict as JSON and plain text."""
+        assert check(formatter.format_dict({"key": "value", "number": 42}, fmt))
+
+    @pytest.mark.parametrize(
+        ("fmt", "check"),
+        [
+            (
+                OutputFormat.JSON,
+                lambda out: [r["name"] for r in json.loads(out)] == ["Alice", "Bob"],
+            ),
+            (OutputFormat.PLAIN, lambda out: "Alice" in out and "Bob" in out),
+        ],
+        ids=["json", "plain"],
+    )
+    def test_format_list(
+        self, formatter: OutputFormatter, fmt: OutputFormat, check: Callable[[str], bool]
+    ) -> None:
+        """Test formatting a list of dicts as JSON and plain text."""
+        data = [
+            {"name": "Alice", "age": 30},
+            {"name": "Bob", "age": 25},
+        ]
 
-        result = formatter.format_dict(data, OutputFormat.JSON)
-        parsed = json.loads(result)
+        assert check(formatter.format_list(data, fmt, headers=["name", "age"]))
 
-        assert parsed["key"] == "value"
-        assert parsed["number"] == 42
+    def test_format_list_empty(self, formatter: OutputFormatter) -> None:
+        """Test formatting empty list."""
+        result = formatter.format_list([], OutputFormat.JSON)
+        assert result == "[]"
 
-    def test_format_dict_plain(self) -> None:
-        """Test formatting dict as plain text."""
-        formatter = OutputFormatter()
-        data = {"key": "value", "number": 42}
+        result = formatter.format_list([], OutputFormat.PLAIN)
+        assert result == "No results"
 
-        result = formatter.format_dict(data, OutputFormat.PLAIN)
+    @pytest.mark.parametrize("no_color", [True, False])
+    def test_messages_follow_color_mode(
+        self, monkeypatch: pytest.MonkeyPatch, no_color: bool
+    ) -> None:
+        """Test message prefixes are chosen once for the color mode."""
+        from rich.console import Console
 
-        assert "key: value" in result
-        assert "number: 42" in result
+        if no_color:
+            monkeypatch.setenv("NO_COLOR", "1")
+        else:
+            monkeypatch.delenv("NO_COLOR", raising=False)
+        console = Console(record=True, width=80, force_terminal=True)
+        formatter = OutputFormatter(console=console)
 
-    def test_format_list_json(self) -> None:
-        """Test formatting list as JSON."""
-        formatter = OutputFormatter()
-        data = [
-            {"name": "Alice", "age": 30},
-            {"name": "Bob", "age": 25},
-        ]
+        formatter.error("boom")
 
-        result = formatter.format_list(data, OutputFormat.JSON)
-        parsed = json.loads(result)
+        styled = console.export_text(styles=True, clear=False)
+        assert console.export_text().strip() == "Error: boom"
+        assert ("\x1b[" in styled) is not no_color
 
-        assert len(parsed) == 2
-        assert parsed[0]["name"] == "Alice"
+    def test_print_list_table_rendered_once(self) -> None:
+        """Test tables are printed directly instead of via a captured string."""
+        from rich.console import Console
+        from rich.table import Table
 
-    def test_format_list_plain(self) -> None:
-        """Test formatting list as plain text."""
-        formatter = OutputFormatter()
-        data = [
-            {"name": "Alice", "age": 30},
-            {"name": "Bob", "age": 25},
-        ]
+        console = Console(record=True, width=80)
+        formatter = OutputFormatter(console=console)
+        data = [{"name": "Alice", "age": 30}]
 
-        result = formatter.format_list(data, OutputFormat.PLAIN, headers=["name", "age"])
+        assert isinstance(formatter.render_list(data, OutputFormat.TABLE), Table)
+        with patch.object(console, "capture") as mock_capture:
+            formatter.print_list(data, OutputFormat.TABLE)
 
-        assert "Alice" in result
-        assert "Bob" in result
+        mock_capture.assert_not_called()
+        assert "Alice" in console.export_text()
+        assert "Alice" in formatter.format_list(data, OutputFormat.TABLE)
 
-    def test_format_list_empty(self) -> None:
-        """Test formatting empty list."""
-        formatter = OutputFormatter()
 
-        result = formatter.format_list([], OutputFormat.JSON)
-        assert result == "[]"
+class TestImport:
+    """Tests for module import cost."""
 
-        result = formatter.format_list([], OutputFormat.PLAIN)
-        assert result == "No results"
+    def test_import_defers_rich(self) -> None:
+        """Test importing output and logging helpers doesn't load rich."""
+        code = (
+            "import sys, thenvoi_cli.output, thenvoi_cli.logging_config; "
+            "print(sorted(m for m in sys.modules if m.startswith('rich')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestToJson:
+    """Tests for the JSON serialization helper."""
+
+    def test_to_json_roundtrip(self) -> None:
+        """Test serializing nested data."""
+        data = {"name": "agent", "tags": ["a", "b"], "count": 2}
+
+        assert json.loads(to_json(data)) == data
+
+    def test_to_json_non_serializable(self) -> None:
+        """Test that unknown types fall back to str()."""
+        from pathlib import Path
+
+        assert json.loads(to_json({"path": Path("/tmp")})) == {"path": "/tmp"}
+
+    def test_to_json_stdlib_fallback(self) -> None:
+        """Test serialization without orjson installed."""
+        with patch("thenvoi_cli.output.orjson", None):
+            result = to_json([{"id": 1}])
+
+        assert result == '[\n  {\n    "id": 1\n  }\n]'
+
+    def test_to_json_compact(self) -> None:
+        """Test compact output."""
+        assert "\n" not in to_json({"a": 1, "b": [1, 2]}, indent=False)
+
+
+class TestPrintJson:
+    """Tests for writing JSON to stdout."""
+
+    def test_print_json_unwrapped(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test long values and brackets are written verbatim."""
+        data = {"message": "[bold]" + "word " * 40}
+
+        print_json(data)
+
+        out = capsys.readouterr().out
+        assert out.endswith("\n")
+        assert json.loads(out) == data
+
+    def test_print_json_compact(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test compact output is a single line."""
+        print_json({"room_id": "room-1"}, indent=False)
+
+        out = capsys.readouterr().out
+        assert out.count("\n") == 1
+        assert json.loads(out) == {"room_id": "room-1"}
+
+    def test_print_json_stdlib_fallback(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test writing without orjson installed."""
+        with patch("thenvoi_cli.output.orjson", None):
+            print_json({"room_id": "room-1"}, indent=False)
+
+        assert capsys.readouterr().out == '{"room_id": "room-1"}\n'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_print_json_datetime_iso(
+        self, capsys: pytest.CaptureFixture[str], use_orjson: bool
+    ) -> None:
+        """Test datetimes are written as ISO 8601 by both encoders."""
+        from datetime import datetime
+
+        encoder = pytest.importorskip("orjson") if use_orjson else None
+        started = datetime(2024, 1, 1, 12, 0, 0, 123456)
+        with patch("thenvoi_cli.output.orjson", encoder):
+            print_json({"started_at": started}, indent=False)
+
+        assert json.loads(capsys.readouterr().out) == {"started_at": started.isoformat()}
+
+
+class TestPrintLines:
+    """Tests for writing plain-text lines to stdout."""
+
+    def test_print_lines_verbatim(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test lines are written without markup processing."""
+        print_lines(["[bold]agent[/bold]: ok", "second"])
+
+        assert capsys.readouterr().out == "[bold]agent[/bold]: ok\nsecond\n"
 
 
 class TestMaskFunctions:
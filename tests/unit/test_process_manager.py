@@ -0,0 +1,171 @@
+"""Tests for ProcessManager."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from thenvoi_cli.process_manager import ProcessManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> ProcessManager:
+    """ProcessManager backed by a temp state directory."""
+    return ProcessManager(state_dir=tmp_path / "state")
+
+
+def _spawn_agent(
+    manager: ProcessManager, name: str, ignore_term: bool = False
+) -> subprocess.Popen[bytes]:
+    """Start a sleeping child, registered and reaped in the background."""
+    handler = "signal.SIG_IGN" if ignore_term else "signal.SIG_DFL"
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            f"import signal, time; signal.signal(signal.SIGTERM, {handler}); "
+            "print('ready', flush=True); time.sleep(60)",
+        ],
+        stdout=subprocess.PIPE,
+    )
+    assert proc.stdout is not None
+    proc.stdout.readline()
+    proc.stdout.close()
+    # Reap on exit so the PID doesn't linger as a zombie
+    threading.Thread(target=proc.wait, daemon=True).start()
+    manager.register_agent(name, proc.pid)
+    return proc
+
+
+class TestListRunningAgents:
+    """Tests for list_running_agents."""
+
+    def test_lists_live_agents_with_info(self, manager: ProcessManager) -> None:
+        """Test a registered live process is listed with its adapter."""
+        manager.register_agent("live-agent", os.getpid(), "passthrough")
+
+        agents = manager.list_running_agents()
+
+        assert [(a.name, a.pid, a.adapter) for a in agents] == [
+            ("live-agent", os.getpid(), "passthrough")
+        ]
+
+    def test_stale_pid_file_is_cleaned_up(self, manager: ProcessManager) -> None:
+        """Test a dead PID is dropped and its state files removed."""
+        manager.register_agent("dead-agent", 2**22 + 1, "passthrough")
+
+        assert manager.list_running_agents() == []
+        assert list(manager.state_dir.iterdir()) == []
+
+    def test_registration_is_one_file(self, manager: ProcessManager) -> None:
+        """Test an agent's pid, start time and adapter live in one state file."""
+        manager.register_agent("agent", os.getpid(), "passthrough")
+
+        assert [p.name for p in manager.state_dir.iterdir()] == ["agent.state"]
+
+    def test_corrupt_state_file_is_not_listed(self, manager: ProcessManager) -> None:
+        """Test an unreadable state file is treated as not running."""
+        (manager.state_dir / "broken.state").write_text("{not json")
+
+        assert manager.list_running_agents() == []
+
+    def test_legacy_pid_files_listed(self, manager: ProcessManager) -> None:
+        """Test agents registered by older versions are still found."""
+        pid = str(os.getpid())
+        manager._get_pid_file("no-info").write_text(pid)
+        manager._get_pid_file("bad-info").write_text(pid)
+        manager._get_info_file("bad-info").write_text("{not json")
+
+        agents = {a.name: a for a in manager.list_running_agents()}
+
+        assert set(agents) == {"no-info", "bad-info"}
+        assert agents["no-info"].adapter is None
+        assert agents["bad-info"].adapter is None
+
+        manager.unregister_agent("bad-info")
+        assert not manager._get_pid_file("bad-info").exists()
+        assert not manager._get_info_file("bad-info").exists()
+
+
+class TestGetAgentStatus:
+    """Tests for get_agent_status."""
+
+    def test_started_at_round_trip(self, manager: ProcessManager) -> None:
+        """Test the registration time is stored and read back."""
+        before = datetime.now()
+        manager.register_agent("agent", os.getpid(), "passthrough")
+
+        status = manager.get_agent_status("agent")
+
+        assert status is not None
+        assert before - timedelta(seconds=1) <= status.started_at <= datetime.now()
+
+    def test_reads_legacy_iso_timestamp(self, manager: ProcessManager) -> None:
+        """Test info files written by older versions are still understood."""
+        manager._get_pid_file("agent").write_text(str(os.getpid()))
+        manager._get_info_file("agent").write_text(
+            json.dumps({"started_at": "2024-01-01T12:00:00", "adapter": "anthropic"})
+        )
+
+        status = manager.get_agent_status("agent")
+
+        assert status is not None
+        assert status.started_at == datetime(2024, 1, 1, 12, 0, 0)
+        assert status.adapter == "anthropic"
+
+
+class TestUnregisterAgent:
+    """Tests for unregister_agent."""
+
+    def test_unregister_unknown_agent_is_noop(self, manager: ProcessManager) -> None:
+        """Test unregistering an agent without state files does not raise."""
+        manager.unregister_agent("never-registered")
+
+
+class TestStopAgent:
+    """Tests for stop_agent."""
+
+    def test_quick_exit_detected_promptly(self, manager: ProcessManager) -> None:
+        """Test a process that exits on SIGTERM is noticed without a full poll interval."""
+        proc = _spawn_agent(manager, "agent")
+
+        start = time.monotonic()
+        assert manager.stop_agent("agent", timeout=10) is True
+
+        assert time.monotonic() - start < 0.9
+        assert proc.wait(timeout=5) == -signal.SIGTERM
+        assert manager.get_pid("agent") is None
+
+
+class TestStopAll:
+    """Tests for stop_all."""
+
+    def test_signals_all_before_waiting(self, manager: ProcessManager) -> None:
+        """Test agents are stopped together within a single timeout budget."""
+        procs = [_spawn_agent(manager, f"agent-{i}") for i in range(3)]
+
+        start = time.monotonic()
+        count = manager.stop_all(timeout=10)
+
+        assert count == 3
+        assert time.monotonic() - start < 5
+        assert [p.wait(timeout=5) for p in procs] == [-signal.SIGTERM] * 3
+        assert manager.list_running_agents() == []
+
+    def test_escalates_to_sigkill_after_timeout(self, manager: ProcessManager) -> None:
+        """Test agents ignoring SIGTERM are killed once the timeout expires."""
+        stubborn = _spawn_agent(manager, "stubborn", ignore_term=True)
+        polite = _spawn_agent(manager, "polite")
+
+        assert manager.stop_all(timeout=1) == 2
+        assert stubborn.wait(timeout=5) == -signal.SIGKILL
+        assert polite.wait(timeout=5) == -signal.SIGTERM
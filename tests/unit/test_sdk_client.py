@@ -0,0 +1,190 @@
+"""Tests for the SDK client wrapper."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from thenvoi_cli.exceptions import ConnectionError
+from thenvoi_cli.sdk_client import SDKClient, _default_urls, run_async
+
+
+@pytest.fixture
+def mock_agent_tools_module() -> MagicMock:
+    """Stand-in for thenvoi.runtime.tools with a mocked AgentTools."""
+    module = ModuleType("thenvoi.runtime.tools")
+    module.AgentTools = MagicMock(side_effect=lambda **kwargs: MagicMock(**kwargs))  # type: ignore[attr-defined]
+    with patch.dict(sys.modules, {"thenvoi.runtime.tools": module}):
+        yield module.AgentTools  # type: ignore[attr-defined]
+
+
+@pytest.fixture
+def connected_client() -> SDKClient:
+    """SDKClient with a fake link in place of a live connection."""
+    client = SDKClient(agent_id="agent-1", api_key="key", ws_url="wss://x", rest_url="https://x")
+    client._link = MagicMock()
+    return client
+
+
+class TestDefaultUrls:
+    """Tests for the environment URL defaults."""
+
+    @pytest.mark.usefixtures("mock_env_vars")
+    def test_env_urls_read_once(self) -> None:
+        """Test the environment is consulted once and explicit URLs win."""
+        with patch("thenvoi_cli.sdk_client.os.getenv", wraps=os.getenv) as getenv:
+            first = SDKClient(agent_id="agent-1", api_key="key")
+            second = SDKClient(agent_id="agent-1", api_key="key", rest_url="https://x")
+
+        assert (first.ws_url, first.rest_url) == (
+            "wss://test.thenvoi.com/ws",
+            "https://test.thenvoi.com/",
+        )
+        assert (second.ws_url, second.rest_url) == ("wss://test.thenvoi.com/ws", "https://x")
+        assert getenv.call_count == 2
+        assert _default_urls.cache_info().currsize == 1
+
+
+class TestGetTools:
+    """Tests for SDKClient.get_tools."""
+
+    def test_get_tools_not_connected(self) -> None:
+        """Test get_tools requires a connection."""
+        client = SDKClient(
+            agent_id="agent-1", api_key="key", ws_url="wss://x", rest_url="https://x"
+        )
+
+        with pytest.raises(ConnectionError):
+            client.get_tools("room-1")
+
+    def test_get_tools_cached_per_room(
+        self, connected_client: SDKClient, mock_agent_tools_module: MagicMock
+    ) -> None:
+        """Test tools are built once per room."""
+        first = connected_client.get_tools("room-1")
+
+        assert connected_client.get_tools("room-1") is first
+        assert connected_client.get_tools("room-2") is not first
+        assert mock_agent_tools_module.call_count == 2
+
+    async def test_disconnect_clears_tools(
+        self, connected_client: SDKClient, mock_agent_tools_module: MagicMock
+    ) -> None:
+        """Test tools bound to a closed link are discarded."""
+        connected_client._link.disconnect = AsyncMock()
+        connected_client.get_tools("room-1")
+
+        await connected_client.disconnect()
+
+        assert connected_client._tools == {}
+
+
+class TestGetRooms:
+    """Tests for SDKClient.get_rooms."""
+
+    @staticmethod
+    def _page(ids: list[str], total_pages: int | None = None) -> MagicMock:
+        """Build a list_agent_chats response holding the given chat IDs."""
+        response = MagicMock()
+        response.data = [MagicMock(id=i, participant_count=1) for i in ids]
+        response.meta = MagicMock(total_pages=total_pages)
+        return response
+
+    async def test_single_page(self, connected_client: SDKClient) -> None:
+        """Test an unpaginated response is fetched with one request."""
+        list_chats = AsyncMock(return_value=self._page(["a", "b"]))
+        connected_client._link.rest.agent_api.list_agent_chats = list_chats
+
+        rooms = await connected_client.get_rooms()
+
+        assert [r["id"] for r in rooms] == ["a", "b"]
+        list_chats.assert_awaited_once_with()
+
+    async def test_remaining_pages_fetched_concurrently(self, connected_client: SDKClient) -> None:
+        """Test later pages are requested together, capped, and kept in order."""
+        in_flight = 0
+        peak = 0
+
+        async def list_chats(page: int = 1) -> MagicMock:
+            nonlocal in_flight, peak
+            if page == 1:
+                return self._page(["p1"], total_pages=12)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (12 - page))
+            in_flight -= 1
+            return self._page([f"p{page}"])
+
+        connected_client._link.rest.agent_api.list_agent_chats = list_chats
+
+        rooms = await connected_client.get_rooms()
+
+        assert [r["id"] for r in rooms] == [f"p{i}" for i in range(1, 13)]
+        assert 1 < peak <= SDKClient.ROOM_PAGE_CONCURRENCY
+
+    async def test_iter_rooms_yields_first_page_early(self, connected_client: SDKClient) -> None:
+        """Test first-page rooms arrive before later pages finish loading."""
+        release = asyncio.Event()
+
+        async def list_chats(page: int = 1) -> MagicMock:
+            if page == 1:
+                return self._page(["p1"], total_pages=2)
+            await release.wait()
+            return self._page(["p2"])
+
+        connected_client._link.rest.agent_api.list_agent_chats = list_chats
+        rooms = connected_client.iter_rooms()
+
+        assert (await anext(rooms))["id"] == "p1"
+        release.set()
+        assert [r["id"] async for r in rooms] == ["p2"]
+
+    async def test_iter_rooms_bounds_pages_held(self, connected_client: SDKClient) -> None:
+        """Test a page is only requested once an earlier one has been yielded."""
+        total = SDKClient.ROOM_PAGE_CONCURRENCY * 3
+        requested: list[int] = []
+
+        async def list_chats(page: int = 1) -> MagicMock:
+            requested.append(page)
+            return self._page([f"p{page}"], total_pages=total if page == 1 else None)
+
+        connected_client._link.rest.agent_api.list_agent_chats = list_chats
+
+        consumed = 0
+        async for _ in connected_client.iter_rooms():
+            consumed += 1
+            await asyncio.sleep(0)
+            assert len(requested) <= consumed + SDKClient.ROOM_PAGE_CONCURRENCY
+
+        assert consumed == total
+        assert requested == list(range(1, total + 1))
+
+
+class TestRunAsync:
+    """Tests for the run_async helper."""
+
+    def test_run_async_returns_result(self) -> None:
+        """Test a coroutine runs to completion."""
+
+        async def _value() -> int:
+            return 42
+
+        assert run_async(_value()) == 42
+
+    def test_new_runner_uses_uvloop(self) -> None:
+        """Test the uvloop loop factory is used when uvloop is installed."""
+        fake_uvloop = MagicMock()
+        fake_uvloop.new_event_loop = MagicMock(side_effect=asyncio.new_event_loop)
+
+        async def _value() -> int:
+            return 1
+
+        with patch("thenvoi_cli.sdk_client.uvloop", fake_uvloop):
+            assert run_async(_value()) == 1
+
+        fake_uvloop.new_event_loop.assert_called_once()
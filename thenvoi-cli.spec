@@ -23,6 +23,7 @@ a = Analysis(
         'thenvoi_cli.commands.adapters',
         'thenvoi_cli.commands.test',
         'thenvoi_cli.commands.agents',
+        'thenvoi_cli.commands.batch',
         'thenvoi_cli.config_manager',
         'thenvoi_cli.adapter_registry',
         'thenvoi_cli.adapters',
@@ -30,6 +31,7 @@ a = Analysis(
         'thenvoi_cli.sdk_client',
         'thenvoi_cli.process_manager',
         'thenvoi_cli.output',
+        'thenvoi_cli.compat',
         'thenvoi_cli.exceptions',
         'thenvoi_cli.logging_config',
         'typer',
@@ -42,6 +44,8 @@ a = Analysis(
         'rich.logging',
         'rich._unicode_data',
         'yaml',
+        'orjson',
+        'uvloop',
         'httpx',
         'thenvoi_rest',
     ] + rich_hiddenimports,